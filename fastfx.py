@@ -1,9 +1,15 @@
 import bpy, mathutils
-import bmesh
 import os
 import math
+import numpy as np
 from bpy_extras.io_utils import ImportHelper
 import struct
+import io
+import re
+import tempfile
+import zipfile
+import itertools
+from functools import lru_cache
 
 bl_info = {
     "name": "FastFX",
@@ -28,8 +34,14 @@ class Import3DG1(bpy.types.Operator):
     # Filter to show only supported files in the file browser
     filter_glob: bpy.props.StringProperty(default="*.txt;*.3dg1;*.obj", options={'HIDDEN'})
 
+    use_cache: bpy.props.BoolProperty(
+        name="Cache Parsed Data",
+        description="Save the parsed file next to it (.cache.npz) and reuse it on later imports while the file is unchanged",
+        default=False
+    )
+
     def execute(self, context):
-        return read_3dg1(self.filepath, context)
+        return read_3dg1(self.filepath, context, self.use_cache)
 
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
@@ -106,24 +118,19 @@ class VertexOperation(bpy.types.Operator):
             self.report({'ERROR'}, "No active mesh object selected")
             return {'CANCELLED'}
 
-        # Access the mesh data
+        # Access the mesh data as one flat (x, y, z, x, y, z, ...) buffer
         mesh = obj.data
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-
-        for vert in bm.verts:
-            if self.operation == 'ROUND':
-                vert.co[0] = round(vert.co[0], 0)
-                vert.co[1] = round(vert.co[1], 0)
-                vert.co[2] = round(vert.co[2], 0)
-            elif self.operation == 'TRUNCATE':
-                vert.co[0] = math.trunc(vert.co[0])
-                vert.co[1] = math.trunc(vert.co[1])
-                vert.co[2] = math.trunc(vert.co[2])
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+
+        if self.operation == 'ROUND':
+            np.rint(co, out=co)  # Rounds half to even, same as round()
+        elif self.operation == 'TRUNCATE':
+            np.trunc(co, out=co)
 
         # Update the mesh
-        bm.to_mesh(mesh)
-        bm.free()
+        mesh.vertices.foreach_set("co", co)
+        mesh.update()
 
         return {'FINISHED'}
 
@@ -149,6 +156,10 @@ class OBJECT_OT_export_colboxes(bpy.types.Operator):
     bl_label = "Export Colboxes to Clipboard"
 
     def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
         export_colboxes(context)
         self.report({'INFO'}, f"Collision box(es) exported successfully!")
         return {'FINISHED'}
@@ -156,8 +167,13 @@ class OBJECT_OT_export_colboxes(bpy.types.Operator):
 # =========================
 # Colbox exporter
 # =========================
+# Shared defaults for missing colbox properties, tuples so they are never mutated
+colbox_default_offset = (0, 0, 0)
+colbox_default_dimensions = (1, 1, 1)
+
 def export_colboxes(context):
-    colbox_data = []
+    colbox_data = io.StringIO()  # Lines are written straight into one buffer
+    separator = ""
 
     for obj in context.selected_objects:
         if obj.type != 'EMPTY':
@@ -166,99 +182,110 @@ def export_colboxes(context):
         # Fetch custom collision box properties
         label = obj.get("colbox_label", obj.name)
         linked_label = obj.get("colbox_linked_label", "0")
-        offset = obj.get("colbox_offset", [0, 0, 0])
+        offset = obj.get("colbox_offset", colbox_default_offset)
         rotation = obj.get("colbox_rotation", "norot")
-        dimensions = obj.get("colbox_dimensions", [1, 1, 1])
+        dimensions = obj.get("colbox_dimensions", colbox_default_dimensions)
         flags_set = obj.get("colbox_flags_set", "0")
         flags_clear = obj.get("colbox_flags_clear", "0")
         scale = obj.get("colbox_scale", 1)
 
         # Create collision box string
-        colbox_str = f"{label}\tcolbox\t{linked_label}," \
-                     f"{offset[0]},{offset[1]},{offset[2]}," \
-                     f"{rotation}," \
-                     f"{dimensions[0]},{dimensions[1]},{dimensions[2]}," \
-                     f"{flags_set},{flags_clear},{scale}"
-        colbox_data.append(colbox_str)
+        fields = (linked_label, *offset[:3], rotation, *dimensions[:3], flags_set, flags_clear, scale)
+        colbox_data.write(f"{separator}{label}\tcolbox\t")
+        colbox_data.write(",".join(map(str, fields)))
+        separator = "\n"
 
     # Copy all collision boxes to the clipboard
-    bpy.context.window_manager.clipboard = "\n".join(colbox_data)
+    bpy.context.window_manager.clipboard = colbox_data.getvalue()
     return {'FINISHED'}
 
 # =========================
 # Colbox importer
 # =========================
+# label, linked label, offset x/y/z, rotation, dimensions x/y/z, flags set, flags clear and an optional scale
+colbox_line_match = re.compile(
+    r"([^\t]*)\tcolbox\t([^,\t]*),(-?\d+),(-?\d+),(-?\d+),([^,\t]*),(-?\d+),(-?\d+),(-?\d+),([^,\t]*),([^,\t]*)(?:,(-?\d+))?"
+).fullmatch
+
 def import_colboxes_from_clipboard():
     clipboard_content = bpy.context.window_manager.clipboard
     lines = clipboard_content.splitlines()
 
+    # Parse every colbox definition first
+    colboxes = []
+    invalid_lines = []
     for line in lines:
         if not line.strip():
             continue  # Skip empty lines
 
+        # Well-formed lines are parsed in a single regex match
+        match = colbox_line_match(line)
+        if match:
+            label, *colbox_data = match.groups()
+            if colbox_data[10] is None:
+                del colbox_data[10]  # No scale given
+            colboxes.append((label, colbox_data, list(map(int, colbox_data[1:4] + colbox_data[5:8]))))
+            continue
+
         # Parse the colbox definition
         parts = line.split("\t")
         if len(parts) != 3 or parts[1] != "colbox":
-            print(f"Invalid colbox line: {line}")
+            invalid_lines.append(f"Invalid colbox line: {line}")
             continue
 
-        label = parts[0]
         colbox_data = parts[2].split(",")
+        colboxes.append((parts[0], colbox_data, list(map(int, colbox_data[1:4] + colbox_data[5:8]))))
 
-        # Extract individual fields
-        linked_label = colbox_data[0]
-        offset = list(map(int, colbox_data[1:4]))
-        rotation = colbox_data[4]
-        dimensions = list(map(int, colbox_data[5:8]))
-        flags_set = colbox_data[8]
-        flags_clear = colbox_data[9]
-        scale = int(colbox_data[10]) if len(colbox_data) > 10 else 0  # Default to 0 if scale is missing
+    if invalid_lines:
+        print("\n".join(invalid_lines))  # Report them all in one go
+    if not colboxes:
+        return {'FINISHED'}
+
+    # Offsets and dimensions of all colboxes, one row each
+    values = np.array([colbox_values for _, _, colbox_values in colboxes], dtype=np.int64)
+    offsets = values[:, 0:3]
+    dimensions = values[:, 3:6]
+    scales = np.array([int(colbox_data[10]) if len(colbox_data) > 10 else 0 for _, colbox_data, _ in colboxes])  # Default to 0 if scale is missing
 
-        # Invert X (Blender Z)
-        offset[0] = offset[0] * -1
+    # Invert X and Y, then swap Y and Z axes for Blender
+    blender_offsets = np.column_stack((-offsets[:, 0], offsets[:, 2], -offsets[:, 1]))
+    blender_dimensions = dimensions[:, [0, 2, 1]]
 
-        # Invert Y (Blender Z)
-        offset[1] = offset[1] * -1
+    # Location is the offset scaled by 2^scale
+    locations = blender_offsets * np.exp2(scales)[:, None]
 
-        # Swap Y and Z axes for Blender
-        offset[1], offset[2] = offset[2], offset[1]
-        dimensions[1], dimensions[2] = dimensions[2], dimensions[1]
+    # Bind the RNA lookups used for every colbox once
+    get_object = bpy.data.objects.get
+    new_object = bpy.data.objects.new
+    link_object = bpy.context.collection.objects.link
 
+    for (label, colbox_data, _), offset, dims, blender_dims, location, scale in zip(
+        colboxes, offsets.tolist(), dimensions.tolist(), blender_dimensions.tolist(), locations.tolist(), scales.tolist()
+    ):
         # Find or create an object for the colbox
-        obj = bpy.data.objects.get(label) or bpy.data.objects.new(label, None)
-        bpy.context.collection.objects.link(obj)
+        obj = get_object(label) or new_object(label, None)
+        link_object(obj)
 
         # Set the object type to EMPTY and its display type to CUBE
         obj.empty_display_type = 'CUBE'
 
         # Size the empty to match the dimensions
-        obj.empty_display_size = max(dimensions)  # Use the largest dimension for uniform scaling
-        obj.scale = (dimensions[0] / obj.empty_display_size, 
-                     dimensions[1] / obj.empty_display_size, 
-                     dimensions[2] / obj.empty_display_size)
+        obj.empty_display_size = max(blender_dims)  # Use the largest dimension for uniform scaling
+        obj.scale = (blender_dims[0] / obj.empty_display_size,
+                     blender_dims[1] / obj.empty_display_size,
+                     blender_dims[2] / obj.empty_display_size)
 
         # Adjust location based on offset and scale
-        scaled_offset = [o * (2 ** scale) for o in offset]
-        obj.location = scaled_offset
-
-        # Invert X again so the properties are correct for manual exporting
-        offset[0] = offset[0] * -1
+        obj.location = location
 
-        # Invert Z again so the properties are correct for manual exporting
-        offset[2] = offset[2] * -1
-
-        # Swap Y and Z axes back for same reason
-        offset[1], offset[2] = offset[2], offset[1]
-        dimensions[1], dimensions[2] = dimensions[2], dimensions[1]
-
-        # Store colbox data in the object
+        # Store colbox data in the object, in Star Fox's axes so the properties are correct for manual exporting
         obj["colbox_label"] = label
-        obj["colbox_linked_label"] = linked_label
+        obj["colbox_linked_label"] = colbox_data[0]
         obj["colbox_offset"] = offset
-        obj["colbox_rotation"] = rotation
-        obj["colbox_dimensions"] = dimensions
-        obj["colbox_flags_set"] = flags_set
-        obj["colbox_flags_clear"] = flags_clear
+        obj["colbox_rotation"] = colbox_data[4]
+        obj["colbox_dimensions"] = dims
+        obj["colbox_flags_set"] = colbox_data[8]
+        obj["colbox_flags_clear"] = colbox_data[9]
         obj["colbox_scale"] = scale
 
     return {'FINISHED'}
@@ -272,18 +299,22 @@ class OBJECT_OT_update_colboxes(bpy.types.Operator):
     bl_label = "Update Colboxes From Properties"
 
     def execute(self, context):
-        updated_count = 0
-        for obj in context.selected_objects:
-            if "colbox_label" in obj:
-                update_colbox(obj)
-                updated_count += 1
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        colboxes = [obj for obj in context.selected_objects if "colbox_label" in obj]
+        update_colboxes(colboxes)
 
-        self.report({'INFO'}, f"Updated {updated_count} collision boxes")
+        self.report({'INFO'}, f"Updated {len(colboxes)} collision boxes")
         return {'FINISHED'}
 
-def update_colbox(obj):
+def update_colbox(obj, verbose=True):
     """
     Updates the visual and transformation properties of a collision box based on its stored properties.
+
+    :param obj: Collision box object.
+    :param verbose: Print a message once the colbox is updated.
     """
     if not obj or "colbox_label" not in obj:
         print(f"Object '{obj.name}' is not a valid collision box.")
@@ -292,42 +323,70 @@ def update_colbox(obj):
     # Fetch stored properties
     label = obj.get("colbox_label", obj.name)
     linked_label = obj.get("colbox_linked_label", "0")
-    offset = obj.get("colbox_offset", [0, 0, 0])
+    offset = obj.get("colbox_offset", colbox_default_offset)
     rotation = obj.get("colbox_rotation", "norot")
-    dimensions = obj.get("colbox_dimensions", [1, 1, 1])
+    dimensions = obj.get("colbox_dimensions", colbox_default_dimensions)
     scale = obj.get("colbox_scale", 0)
 
-    # Adjust offset: invert X/Y and swap Y/Z for Blender
-    offset[0] = offset[0] * -1
-    offset[1] = offset[1] * -1
-    offset[1], offset[2] = offset[2], offset[1]
-
-    # Adjust dimensions: swap Y/Z for Blender
-    dimensions[1], dimensions[2] = dimensions[2], dimensions[1]
+    # Blender-space copies, the stored properties are left untouched
+    locations, display_sizes, scales = colbox_to_blender_space([offset[:3]], [dimensions[:3]])
 
     # Update the EMPTY's visual size and location
     obj.empty_display_type = 'CUBE'
-    obj.empty_display_size = max(dimensions)  # Use the largest dimension for consistent scaling
-    obj.scale = (dimensions[0] / obj.empty_display_size,
-                 dimensions[1] / obj.empty_display_size,
-                 dimensions[2] / obj.empty_display_size)
+    obj.empty_display_size = display_sizes[0]  # Use the largest dimension for consistent scaling
+    obj.scale = scales[0]
 
     # Apply offset to location
-    obj.location = offset
-
-    # Adjust offset: invert X/Y and swap Y/Z for Blender
-    offset[0] = offset[0] * -1
-    offset[2] = offset[2] * -1
-    offset[1], offset[2] = offset[2], offset[1]
-
-    # Adjust dimensions: swap Y/Z for Blender
-    dimensions[1], dimensions[2] = dimensions[2], dimensions[1]
+    obj.location = locations[0]
 
     # Store colbox data in the object
     obj["colbox_dimensions"] = dimensions
     obj["colbox_scale"] = scale
 
-    print(f"Collision box '{label}' updated successfully!")
+    if verbose:
+        print(f"Collision box '{label}' updated successfully!")
+
+def update_colboxes(objs):
+    """
+    Batch version of update_colbox. Offsets and dimensions of every colbox are gathered into
+    arrays so the axis conversion is done once for the whole selection.
+
+    :param objs: Collision box objects.
+    """
+    if not objs:
+        return
+
+    offsets = [obj.get("colbox_offset", colbox_default_offset)[:3] for obj in objs]
+    dimensions = [obj.get("colbox_dimensions", colbox_default_dimensions) for obj in objs]
+    locations, display_sizes, scales = colbox_to_blender_space(offsets, [dims[:3] for dims in dimensions])
+
+    for obj, dims, location, display_size, scale in zip(objs, dimensions, locations, display_sizes, scales):
+        obj.empty_display_type = 'CUBE'
+        obj.empty_display_size = display_size
+        obj.scale = scale
+        obj.location = location
+
+        # Store colbox data in the object
+        obj["colbox_dimensions"] = dims
+        obj["colbox_scale"] = obj.get("colbox_scale", 0)
+
+def colbox_to_blender_space(offsets, dimensions):
+    """
+    Converts colbox offsets and dimensions to Blender space, shared by update_colbox and update_colboxes.
+
+    :param offsets: Sequence of (x, y, z) colbox offsets.
+    :param dimensions: Sequence of (x, y, z) colbox dimensions.
+    :return: Tuple of (locations, display sizes, scales) lists, one entry per colbox.
+    """
+    offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+    dimensions = np.asarray(dimensions, dtype=np.float64).reshape(-1, 3)
+
+    # Invert X/Y and swap Y/Z for the offsets, swap Y/Z for the dimensions
+    locations = np.column_stack((-offsets[:, 0], offsets[:, 2], -offsets[:, 1]))
+    blender_dimensions = dimensions[:, [0, 2, 1]]
+    display_sizes = blender_dimensions.max(axis=1)  # Use the largest dimension for consistent scaling
+    scales = blender_dimensions / display_sizes[:, None]
+    return locations.tolist(), display_sizes.tolist(), scales.tolist()
 
 # =========================
 # Update colbox position based on its visual position
@@ -338,41 +397,39 @@ class OBJECT_OT_update_colbox_offsets(bpy.types.Operator):
     bl_label = "Update Colbox Positions"
 
     def execute(self, context):
-        updated_count = 0
-        for obj in context.selected_objects:
-            if "colbox_label" in obj:
-                update_colbox_offset(obj)
-                updated_count += 1
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        colboxes = [obj for obj in context.selected_objects if "colbox_label" in obj]
+        for obj in colboxes:
+            update_colbox_offset(obj, verbose=False)
 
-        self.report({'INFO'}, f"Updated offsets for {updated_count} collision boxes")
+        self.report({'INFO'}, f"Updated offsets for {len(colboxes)} collision boxes")
         return {'FINISHED'}
 
 
-def update_colbox_offset(obj):
+def update_colbox_offset(obj, verbose=True):
     """
     Updates the colbox_offset property based on the current position of the object in the scene.
+
+    :param obj: Collision box object.
+    :param verbose: Print a message once the offset is updated.
     """
     if not obj or "colbox_label" not in obj:
         print(f"Object '{obj.name}' is not a valid collision box.")
         return
 
-    # Get the current location of the object
-    location = list(obj.location)
-
     # Adjust for Blender's coordinate system: swap Y/Z, invert Y/X
-    location[2] = location[2] * -1  # Invert Z (Blender's Z = target's Y)
-    location[1], location[2] = location[2], location[1]  # Swap Y and Z
-    location[0] = -location[0] # X invert
-
-    # Colbox coordinates must be whole numbers
-    location[0] = math.trunc(location[0])
-    location[1] = math.trunc(location[1])
-    location[2] = math.trunc(location[2])
+    # Colbox coordinates must be whole numbers, int() truncates like math.trunc
+    x, y, z = obj.location
+    location = (int(-x), int(-z), int(y))
 
     # Update the colbox_offset property
     obj["colbox_offset"] = location
 
-    print(f"Collision box '{obj.name}' offset updated to {location}!")
+    if verbose:
+        print(f"Collision box '{obj.name}' offset updated to {location}!")
 
 # =========================
 # Generate a colbox for a selected mesh
@@ -402,26 +459,15 @@ def generate_colbox_from_mesh(obj):
         print("Selected object is not a mesh.")
         return
 
-    # Calculate the bounding box dimensions and position
-    min_corner = [int(round(coord)) for coord in obj.bound_box[0]]
-    max_corner = [int(round(coord)) for coord in obj.bound_box[6]]
-    
-    dimensions = [
-        max_corner[0] - min_corner[0],
-        max_corner[2] - min_corner[2],
-        max_corner[1] - min_corner[1],
-    ]
-    
-    center_position = [
-        int(round((min_corner[0] + max_corner[0]) / 2)),
-        int(round((min_corner[1] + max_corner[1]) / 2)),
-        int(round((min_corner[2] + max_corner[2]) / 2)),
-    ]
+    # Calculate the bounding box dimensions and position from all 8 corners
+    bound_box = np.array(obj.bound_box, dtype=np.float64)
+    min_corner = np.rint(bound_box.min(axis=0)).astype(np.int64)
+    max_corner = np.rint(bound_box.max(axis=0)).astype(np.int64)
 
-    # Halve dimensions to fit around object
-    dimensions[0] = math.trunc(dimensions[0]/2)
-    dimensions[1] = math.trunc(dimensions[1]/2)
-    dimensions[2] = math.trunc(dimensions[2]/2)
+    # Halve dimensions to fit around object, with Y/Z swapped
+    dimensions = ((max_corner - min_corner)[[0, 2, 1]] // 2).tolist()
+
+    center_position = np.rint((min_corner + max_corner) / 2).astype(np.int64).tolist()
 
     # Create the colbox
     colbox_label = f"{obj.name}_col"
@@ -450,8 +496,8 @@ def generate_colbox_from_mesh(obj):
     colbox["colbox_flags_clear"] = "0"
     colbox["colbox_scale"] = 0  # Default scale
 
-    update_colbox_offset(colbox)
-    update_colbox(colbox)
+    update_colbox_offset(colbox, verbose=False)
+    update_colbox(colbox, verbose=False)
 
     print(f"Collision box '{colbox_label}' created for mesh '{obj.name}'.")
     return colbox
@@ -468,13 +514,14 @@ def srgb_to_linearrgb(c):
     else:
         return ((c + 0.055) / 1.055) ** 2.4
 
+# Linear value of every possible 8-bit sRGB channel value
+srgb8_to_linearrgb = tuple(srgb_to_linearrgb(i / 255.0) for i in range(256))
+
+@lru_cache(maxsize=512)  # Colors are immutable tuples, so repeated lookups can share them
 def hex_to_rgb(hex_color, alpha=1.0):
     """Converts a hex color code to Blender-compatible linear RGB values."""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
-    return (srgb_to_linearrgb(r), srgb_to_linearrgb(g), srgb_to_linearrgb(b), alpha)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
+    return (srgb8_to_linearrgb[r], srgb8_to_linearrgb[g], srgb8_to_linearrgb[b], alpha)
 
 # =========================
 # Simple Color Palette Dictionary
@@ -539,6 +586,21 @@ id_0_c_rgb = {
     52: "#F6FFFF",  # FX52 - Fading   (Solid Red/Orange/Turquoise/Blue)
 }
 
+# Linear RGB versions of the colors above, converted once when the add-on loads
+id_0_c_linear_rgb = {color_index: hex_to_rgb(hex_color) for color_index, hex_color in id_0_c_rgb.items()}
+white_linear_rgb = hex_to_rgb("#FFFFFF")  # Default for color indices not in the palette
+
+def material_color_index(material_name, default=0):
+    """
+    Extracts the color index from an FX#/FE# material name.
+
+    :param material_name: Material name, e.g. "FX12".
+    :param default: Value returned when the name has no numeric suffix.
+    :return: The color index, or default.
+    """
+    suffix = material_name[2:]
+    return int(suffix) if suffix.isdecimal() else default
+
 # =========================
 # Super FX Material Color Palette Dictionary
 # =========================
@@ -905,93 +967,278 @@ id_0_c_components_rgb = {
     },
 }
 
+# Same settings as (input name, value) pairs, converted once when the add-on loads:
+# colours to linear RGB, other settings to floats
+id_0_c_components_linear_rgb = {
+    color_index: tuple(
+        (input_name, hex_to_rgb(value) if input_name.startswith("Colour") else float(value))
+        for input_name, value in settings.items()
+    )
+    for color_index, settings in id_0_c_components_rgb.items()
+}
+
+
+# End-of-file marker written after 3DG1/3DAN data
+eof_marker = chr(0x1A)
+
+# =========================
+# FX Material Helper
+# =========================
+def get_fx_material(material_name, linear_rgb_color):
+    """
+    Gets or creates a material and sets its Principled BSDF base color.
+
+    Node settings are only written when they change, so materials left by a previous
+    import don't trigger node tree updates.
+
+    :param material_name: Name of the material (e.g. "FX12").
+    :param linear_rgb_color: Base color as linear RGBA.
+    :return: The material.
+    """
+    material = bpy.data.materials.get(material_name) or bpy.data.materials.new(name=material_name)
+    if not material.use_nodes:
+        material.use_nodes = True
+    bsdf = material.node_tree.nodes.get("Principled BSDF")
+    if bsdf:
+        base_color = bsdf.inputs["Base Color"]
+        if not np.allclose(base_color.default_value, linear_rgb_color, rtol=0.0, atol=1e-6):
+            base_color.default_value = linear_rgb_color
+    return material
+
+# =========================
+# Mesh Fill Helper
+# =========================
+def fill_mesh(mesh, vertices, loop_totals, loop_vertices):
+    """
+    Fills an empty mesh from flat buffers, same result as from_pydata without the per-element copies.
+
+    :param mesh: Empty mesh to fill.
+    :param vertices: Vertex coordinates, (n, 3) or flat.
+    :param loop_totals: Number of points of each face.
+    :param loop_vertices: Point indices of all faces, one after another.
+    """
+    vertices = np.asarray(vertices, dtype=np.float32).ravel()
+    loop_totals = np.asarray(loop_totals, dtype=np.int32)
+    loop_vertices = np.asarray(loop_vertices, dtype=np.int32)
+
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    mesh.vertices.add(len(vertices) // 3)
+    mesh.loops.add(len(loop_vertices))
+    mesh.polygons.add(len(loop_totals))
+    mesh.vertices.foreach_set("co", vertices)
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.loops.foreach_set("vertex_index", loop_vertices)
+    mesh.update(calc_edges=True)
+
+# =========================
+# 3DG1 Parser
+# =========================
+def parse_3dg1(filepath):
+    """
+    Parses a 3DG1 file into flat arrays.
+
+    :param filepath: Path to the 3DG1 file.
+    :return: Tuple of (vertices, loop_totals, loop_vertices, poly_colors, is_hex_color_format).
+    """
+    # Read the whole file at once as bytes, skipping blank lines (M2FX compatibility)
+    with open(filepath, 'rb') as file:
+        lines = [line for line in map(bytes.strip, file.read().splitlines()) if line]
+
+    # Read and validate header
+    header = lines[0]
+    if header not in {b"3DG1", b"3DGI"}:
+        raise ValueError("Invalid file format: Not a 3DG1 file")
+
+    # Read vertex count
+    vertex_count = int(lines[1])
+
+    # Read vertices in one pass, parsed as float (M2FX compatibility)
+    coords = np.fromstring(b" ".join(lines[2:2 + vertex_count]), dtype=np.float64, sep=" ")
+    coords = coords.reshape(vertex_count, 3)
+    # Translate from 3DG1/3DAN coordinate system to Blender's (Z is up/down)
+    vertices = np.column_stack((coords[:, 0], -coords[:, 2], coords[:, 1])).astype(np.float32)
+
+    # Read polygons
+    polygon_lines = lines[2 + vertex_count:]
+    eof_line = eof_marker.encode("ascii")
+    if eof_line in polygon_lines:  # Stop at the EOF marker
+        polygon_lines = polygon_lines[:polygon_lines.index(eof_line)]
+
+    # Group polygon lines by point count, so each group can be parsed in one go
+    groups = {}
+    for position, line in enumerate(polygon_lines):
+        groups.setdefault(int(line.split(None, 1)[0]), []).append(position)
+
+    poly_count = len(polygon_lines)
+    loop_totals = np.zeros(poly_count, dtype=np.int32)
+    poly_colors = np.zeros(poly_count, dtype=np.int64)
+    group_indices = []  # (positions, indices) per group parsed at once, one row of indices per polygon
+    line_indices = {}  # position -> indices for lines parsed one by one
+    is_hex_color_format = False  # Detect if we are using hex colors
+    for npoints, positions in groups.items():
+        group_lines = [polygon_lines[position] for position in positions]
+        positions = np.array(positions)
+        block = b" ".join(group_lines)
+        if (
+            npoints >= 0 and b"0x" not in block and b"\t" not in block and b"  " not in block
+            and all(line.count(b" ") == npoints + 1 for line in group_lines)
+        ):
+            # Every line is "npoints index... color", parse the whole group at once
+            values = np.fromstring(block, dtype=np.int64, sep=" ")
+            if values.size == len(positions) * (npoints + 2):
+                values = values.reshape(len(positions), npoints + 2)
+                loop_totals[positions] = npoints
+                poly_colors[positions] = values[:, -1]
+                group_indices.append((positions, values[:, 1:-1]))
+                continue
+
+        # Hex colors, missing colors or extra values, parse line by line
+        for position in positions.tolist():
+            parts = polygon_lines[position].split()
+            indices = list(map(int, parts[1:npoints + 1]))
+
+            # Determine if it's a hex color format
+            if len(parts) > npoints + 1:
+                color_value = parts[npoints + 1]
+                if color_value.startswith(b"0x"):  # Hex color in BGR format
+                    is_hex_color_format = True
+                    color_bgr = int(color_value, 16)
+                    # Convert BGR to RGB
+                    color_index = ((color_bgr & 0xFF) << 16) | (color_bgr & 0xFF00) | ((color_bgr >> 16) & 0xFF)
+                else:
+                    color_index = int(color_value)
+            else:
+                color_index = 0  # Default to 0 if no color index or color value is present
+
+            loop_totals[position] = len(indices)
+            poly_colors[position] = color_index
+            line_indices[position] = indices
+
+    # Scatter each group's indices into file order
+    loop_ends = np.cumsum(loop_totals, dtype=np.int64)
+    loop_vertices = np.empty(int(loop_ends[-1]) if poly_count else 0, dtype=np.int32)
+    for positions, indices in group_indices:
+        loop_positions = (loop_ends[positions] - indices.shape[1])[:, None] + np.arange(indices.shape[1])
+        loop_vertices[loop_positions] = indices
+    for position, indices in line_indices.items():
+        loop_vertices[loop_ends[position] - len(indices):loop_ends[position]] = indices
+
+    return vertices, loop_totals, loop_vertices, poly_colors, is_hex_color_format
+
+# =========================
+# 3DG1 Parse Cache
+# =========================
+def load_3dg1_cache(filepath):
+    """
+    Loads the parsed arrays of a 3DG1 file from its cache file, if the cache is up to date.
+
+    :param filepath: Path to the 3DG1 file.
+    :return: Same tuple as parse_3dg1, or None if there is no usable cache.
+    """
+    cache_path = filepath + ".cache.npz"
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+            return None  # Source changed since the cache was written
+        with np.load(cache_path) as cache:
+            return (
+                cache["vertices"],
+                cache["loop_totals"],
+                cache["loop_vertices"],
+                cache["poly_colors"],
+                bool(cache["is_hex_color_format"]),
+            )
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+        # Unreadable or incomplete cache, drop it so the next import doesn't trip over it again
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+def save_3dg1_cache(filepath, parsed):
+    """
+    Saves the parsed arrays of a 3DG1 file next to it, so later imports can skip parsing.
+
+    :param filepath: Path to the 3DG1 file.
+    :param parsed: Tuple returned by parse_3dg1.
+    """
+    vertices, loop_totals, loop_vertices, poly_colors, is_hex_color_format = parsed
+    try:
+        # Write to a temporary file first, so a failed save never leaves a partial cache behind
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(filepath)))
+    except OSError:
+        return  # Caching is optional, e.g. the folder may be read-only
+    try:
+        with os.fdopen(fd, "wb") as file:
+            np.savez(
+                file,
+                vertices=vertices,
+                loop_totals=loop_totals,
+                loop_vertices=loop_vertices,
+                poly_colors=poly_colors,
+                is_hex_color_format=is_hex_color_format,
+            )
+        os.replace(temp_path, filepath + ".cache.npz")
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 # =========================
 # 3DG1 Importer
 # =========================
-def read_3dg1(filepath, context):
+def read_3dg1(filepath, context, use_cache=False):
     try:
         # Extract the base name of the file (without extension) to use as object and mesh name
         base_name = os.path.splitext(os.path.basename(filepath))[0]
 
-        with open(filepath, 'r') as file:
-            # Read and validate header
-            header = file.readline().strip()
-            if header not in {"3DG1", "3DGI"}:
-                raise ValueError("Invalid file format: Not a 3DG1 file")
-                return {'CANCELLED'}
-
-            # Read vertex count
-            vertex_count = int(file.readline().strip())
-            vertices = []
-
-            # Read vertices
-            for _ in range(vertex_count):
-                line = file.readline().strip()
-                while not line:  # Skip blank lines (M2FX compatibility)
-                    line = file.readline().strip()
-                x, y, z = map(float, line.split())  # Parse as float (M2FX compatibility)
-                vertices.append((x, -z, y)) # Translate from 3DG1/3DAN coordinate system to Blender's (Z is up/down)
-
-            # Read polygons
-            polygons = []
-            material_mapping = {}
-            is_hex_color_format = False  # Detect if we are using hex colors
-            for line in file:
-                line = line.strip()
-                if not line:  # Skip blank lines (M2FX compatibility)
-                    continue
-                if line == chr(0x1A):  # EOF marker
-                    break
-                parts = line.split()
-                npoints = int(parts[0])
-                indices = list(map(int, parts[1:npoints + 1]))
-
-                # Determine if it's a hex color format
-                if len(parts) > npoints + 1:
-                    color_value = parts[npoints + 1]
-                    if color_value.startswith("0x"):  # Hex color in BGR format
-                        is_hex_color_format = True
-                        color_bgr = int(color_value, 16)
-                        # Convert BGR to RGB
-                        color_index = ((color_bgr & 0xFF) << 16) | (color_bgr & 0xFF00) | ((color_bgr >> 16) & 0xFF)
-                    else:
-                        color_index = int(color_value)
-                else:
-                    color_index = 0  # Default to 0 if no color index or color value is present
+        # Parse the file, or load the arrays from a previous import
+        parsed = load_3dg1_cache(filepath) if use_cache else None
+        if parsed is None:
+            parsed = parse_3dg1(filepath)
+            if use_cache:
+                save_3dg1_cache(filepath, parsed)
+        vertices, loop_totals, loop_vertices, poly_colors, is_hex_color_format = parsed
+
+        # One material per color index used, in sorted order, and the slot of each polygon
+        color_indices, material_indices = np.unique(poly_colors, return_inverse=True)
+        material_mapping = {color_index: f"FX{color_index}" for color_index in color_indices.tolist()}
+
+        # Create materials and assign predefined colors
+        material_list = []
+        for color_index, material_name in material_mapping.items():
+            if is_hex_color_format:
+                # Use color_index directly as it represents RGB for the hex color format
+                linear_rgb_color = (
+                    srgb8_to_linearrgb[(color_index >> 16) & 0xFF],
+                    srgb8_to_linearrgb[(color_index >> 8) & 0xFF],
+                    srgb8_to_linearrgb[color_index & 0xFF],
+                    1.0,
+                )
+            else:
+                # Use the id_0_c palette for standard color indices
+                linear_rgb_color = id_0_c_linear_rgb.get(color_index, white_linear_rgb)  # Default to white if not defined
+            material_list.append(get_fx_material(material_name, linear_rgb_color))
 
-                polygons.append((indices, color_index))
-                if color_index not in material_mapping:
-                    material_mapping[color_index] = f"FX{color_index}"
+        # Create a new mesh in Blender
+        mesh = bpy.data.meshes.new(base_name)
+        fill_mesh(mesh, vertices, loop_totals, loop_vertices)
 
-            # Create a new mesh in Blender
-            mesh = bpy.data.meshes.new(base_name)
-            mesh.from_pydata(vertices, [], [poly[0] for poly in polygons])
-            obj = bpy.data.objects.new(base_name, mesh)
-            context.collection.objects.link(obj)
+        # Add all material slots in one pass, before the mesh is linked into the scene
+        for material in material_list:
+            mesh.materials.append(material)
 
-            # Create materials and assign predefined colors
-            material_list = []
-            for color_index, material_name in sorted(material_mapping.items()):
-                material = bpy.data.materials.get(material_name) or bpy.data.materials.new(name=material_name)
-                material.use_nodes = True
-                bsdf = material.node_tree.nodes.get("Principled BSDF")
-                if bsdf:
-                    if is_hex_color_format:
-                        # Use color_index directly as it represents RGB for the hex color format
-                        hex_color = f"#{color_index:06X}"
-                    else:
-                        # Use the id_0_c_rgb dictionary for standard color indices
-                        hex_color = id_0_c_rgb.get(color_index, "#FFFFFF")  # Default to white if not defined
-                    linear_rgb_color = hex_to_rgb(hex_color)
-                    bsdf.inputs["Base Color"].default_value = linear_rgb_color  # Linear RGB with alpha
-                material_list.append(material)
-                obj.data.materials.append(material)
-
-            # Assign materials to faces
-            for poly, (_, color_index) in zip(mesh.polygons, polygons):
-                material_index = sorted(material_mapping.keys()).index(color_index)
-                poly.material_index = material_index
+        # Assign materials to faces, material slots follow sorted color index order
+        mesh.polygons.foreach_set("material_index", material_indices.astype(np.int32))
+
+        obj = bpy.data.objects.new(base_name, mesh)
+        context.collection.objects.link(obj)
 
         return {'FINISHED'}
 
@@ -1018,125 +1265,175 @@ def write_3dg1(filepath, obj, sort_mode="distance"):
     :param obj: Blender mesh object to export.
     :param sort_mode: Sorting mode ("distance", "material", "none").
     """
-    # Open the file for writing
-    with open(filepath, "w") as file:
-        # Collect unique vertices and map them to indices
-        original_vertices = [(
-            round(v.co.x), round(v.co.y), round(v.co.z)
-        ) for v in obj.data.vertices]
-
-        index_map = {}
-        vertex_count = 0
-
-        # Pair points for compression
-        sorted_indices = sorted(range(len(original_vertices)), key=lambda i: distance_from_origin(original_vertices[i]))
-        new_vertices = []
-
-        while sorted_indices:
-            current_index = sorted_indices.pop(0)
-            current_point = original_vertices[current_index]
-
-            # Try to find a pair with an inverse-X point
-            best_match = None
-            for candidate_index in sorted_indices:
-                candidate_point = original_vertices[candidate_index]
-                if current_point[1:] == candidate_point[1:] and current_point[0] == -candidate_point[0]:
-                    best_match = candidate_index
-                    break
-
-            # Add the current point
-            new_vertices.append(current_point)
-            index_map[current_index] = len(new_vertices) - 1
+    mesh = obj.data
+
+    # Collect all vertex coordinates at once and round them to whole numbers
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    rounded = np.rint(co).astype(np.int64).reshape(-1, 3)
+    original_vertices = list(map(tuple, rounded.tolist()))
+
+    # Pair points for compression, starting from the point nearest to the origin
+    sorted_order = np.argsort((rounded * rounded).sum(axis=1), kind="stable")
+    sorted_indices = sorted_order.tolist()
+
+    # Pack each point, and its inverse-X point, into a single int key
+    bias = int(np.abs(rounded).max(initial=0))
+    span = 2 * bias + 1
+    if span ** 3 > np.iinfo(np.int64).max:
+        rounded = rounded.astype(object)  # Fall back to Python ints for huge coordinates
+    biased = rounded + bias
+    yz_keys = biased[:, 1] * span + biased[:, 2]
+    keys = (biased[:, 0] * span) * span + yz_keys
+    mirror_keys = ((2 * bias - biased[:, 0]) * span) * span + yz_keys
+
+    # Group identical points into buckets, and find the bucket of each point's inverse-X point (-1 if none)
+    unique_keys, bucket_of = np.unique(keys, return_inverse=True)
+    bucket_of = bucket_of.ravel()
+    mirror_bucket = np.minimum(np.searchsorted(unique_keys, mirror_keys), max(len(unique_keys) - 1, 0))
+    mirror_bucket[unique_keys[mirror_bucket] != mirror_keys] = -1
+    bucket_of = bucket_of.tolist()
+    mirror_bucket = mirror_bucket.tolist()
+
+    # Indices of each bucket, nearest first (popped from the end)
+    grouped = sorted_order[np.argsort(np.asarray(bucket_of)[sorted_order], kind="stable")]
+    bucket_ends = np.cumsum(np.bincount(bucket_of, minlength=len(unique_keys)))
+    remaining = [bucket[::-1].tolist() for bucket in np.split(grouped, bucket_ends[:-1])]
+
+    index_map = [0] * len(original_vertices)
+    new_vertices = []
 
-            # Add its pair if found
-            if best_match is not None:
-                new_vertices.append(original_vertices[best_match])
-                index_map[best_match] = len(new_vertices) - 1
-                sorted_indices.remove(best_match)
+    for current_index in sorted_indices:
+        bucket = remaining[bucket_of[current_index]]
+        if not bucket or bucket[-1] != current_index:
+            continue  # Already added as the pair of a nearer point
+        bucket.pop()
 
-        # Process polygons and edges
-        polygons = []
-        edges = []  # Store edges for colored lines
+        # Add the current point
+        new_vertices.append(original_vertices[current_index])
+        index_map[current_index] = len(new_vertices) - 1
 
-        mesh = obj.data
-        mesh.calc_loop_triangles()
-
-        for poly in mesh.polygons:
-            material_index = poly.material_index
-            material = obj.material_slots[material_index].material
-            if material:
-                if material.name.startswith("FE"):  # Handle edges
-                    try:
-                        edge_color_index = int(material.name[2:])  # Extract color index for edges
-                    except ValueError:
-                        edge_color_index = 0  # Default to 0 if parsing fails
-
-                    for i in range(len(poly.vertices)):
-                        v1 = poly.vertices[i]
-                        v2 = poly.vertices[(i + 1) % len(poly.vertices)]
-                        edges.append((index_map[v1], index_map[v2], edge_color_index))
-
-                elif material.name.startswith("FX"):  # Handle polygons
-                    try:
-                        color_index = int(material.name[2:])  # Extract color index for polygons
-                    except ValueError:
-                        color_index = 0  # Default to 0 if parsing fails
-
-                    poly_vertices = [index_map[vertex] for vertex in poly.vertices]
-                    centroid = tuple(
-                        sum(mesh.vertices[v].co[i] for v in poly.vertices) / len(poly.vertices)
-                        for i in range(3)
-                    )
-                    polygons.append((poly_vertices, color_index, centroid, material_index))
-
-        # Apply sorting based on the selected mode
-        if sort_mode == "distance":
-            polygons.sort(key=lambda p: distance_from_origin(p[2]))  # Sort polygons by centroid distance from origin
-            edges.sort(key=lambda e: distance_from_origin(
-                [(new_vertices[e[0]][i] + new_vertices[e[1]][i]) / 2 for i in range(3)]
-            ))  # Sort edges by midpoint distance from origin
-        elif sort_mode == "material":
-            polygons.sort(key=lambda p: p[3])  # Sort by material index
-
-        if sort_mode == "distance":
-            # Reverse the order so farthest elements are written last
-            polygons.reverse()
-            edges.reverse()
-
-        # Deduplicate edges that occupy the same positions and have the same color
-        deduped_edges = []
-        seen = set()
-        for v1, v2, color_index in edges:
-            p1 = tuple(round(c, 6) for c in new_vertices[v1])
-            p2 = tuple(round(c, 6) for c in new_vertices[v2])
-            key = (p1, p2) if p1 <= p2 else (p2, p1)
-            key = (key, color_index)
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped_edges.append((v1, v2, color_index))
-        edges = deduped_edges
+        # Add its pair (the nearest remaining inverse-X point) if found
+        pair_bucket = remaining[mirror_bucket[current_index]] if mirror_bucket[current_index] >= 0 else None
+        if pair_bucket:
+            best_match = pair_bucket.pop()
+            new_vertices.append(original_vertices[best_match])
+            index_map[best_match] = len(new_vertices) - 1
 
-        # Write 3DG1 header
-        file.write("3DG1\n")
-        file.write(f"{len(new_vertices)}\n")  # Total vertex count
+    # Work out what each material slot exports as ("FE" edges, "FX" polygons) and its color index
+    slot_info = []
+    for slot in obj.material_slots:
+        material = slot.material
+        kind = material.name[:2] if material and material.name[:2] in {"FE", "FX"} else None
+        color_index = material_color_index(material.name) if kind else 0  # Extract color index, 0 if parsing fails
+        slot_info.append((kind, color_index))
+    slot_kinds = np.array([kind or "" for kind, _ in slot_info], dtype="<U2")
+    slot_colors = np.array([color_index for _, color_index in slot_info], dtype=np.int64)
+
+    # Read the polygon layout and loop vertices in bulk
+    poly_count = len(mesh.polygons)
+    material_indices = np.empty(poly_count, dtype=np.int32)
+    loop_starts = np.empty(poly_count, dtype=np.int32)
+    loop_totals = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    poly_kinds = slot_kinds[material_indices]
+    poly_colors = slot_colors[material_indices]
+    index_map = np.asarray(index_map, dtype=np.int64)
+
+    # Each "FE" polygon becomes a closed loop of colored edges
+    selected = np.flatnonzero(poly_kinds == "FE")
+    starts = loop_starts[selected]
+    totals = loop_totals[selected]
+    ends = np.cumsum(totals)
+    loops = np.arange(int(ends[-1]) if len(ends) else 0) + np.repeat(starts - (ends - totals), totals)
+    next_loops = loops + 1
+    next_loops[ends - 1] = starts  # The last edge wraps around to the first loop
+    edges = list(zip(
+        index_map[loop_vertices[loops]].tolist(),
+        index_map[loop_vertices[next_loops]].tolist(),
+        np.repeat(poly_colors[selected], totals).tolist()
+    ))
+
+    # "FX" polygons keep their vertices, with the centroid computed from the unrounded coordinates
+    selected = np.flatnonzero(poly_kinds == "FX")
+    totals = loop_totals[selected]
+    starts = loop_starts[selected]
+    vertex_co = co.astype(np.float64).reshape(-1, 3)
+    centroids = np.zeros((len(selected), 3))
+    for i in range(int(totals.max(initial=0))):
+        has_loop = totals > i
+        centroids[has_loop] += vertex_co[loop_vertices[starts[has_loop] + i]]  # Summed in loop order
+    centroids /= totals[:, None]
+    polygons = [
+        (index_map[loop_vertices[start:start + total]].tolist(), color_index, tuple(centroid), material_index)
+        for start, total, color_index, centroid, material_index in zip(
+            starts.tolist(), totals.tolist(), poly_colors[selected].tolist(),
+            centroids.tolist(), material_indices[selected].tolist()
+        )
+    ]
 
-        # Write vertices
-        for vertex in new_vertices:
-            file.write(f"{vertex[0]} {vertex[2]} {-(vertex[1])}\n")  # Convert back to 3DG1 coordinate system
+    # Apply sorting based on the selected mode
+    if sort_mode == "distance":
+        # Sort polygons by centroid distance from origin
+        x, y, z = centroids.T
+        order = np.argsort(np.sqrt(x * x + y * y + z * z), kind="stable")
+        polygons = [polygons[i] for i in order.tolist()]
+
+        # Sort edges by midpoint distance from origin
+        if edges:
+            new_co = np.array(new_vertices, dtype=np.float64)
+            edge_vertices = np.array([e[:2] for e in edges], dtype=np.int64)
+            x, y, z = ((new_co[edge_vertices[:, 0]] + new_co[edge_vertices[:, 1]]) / 2).T
+            order = np.argsort(np.sqrt(x * x + y * y + z * z), kind="stable")
+            edges = [edges[i] for i in order.tolist()]
+    elif sort_mode == "material":
+        polygons.sort(key=lambda p: p[3])  # Sort by material index
 
-        # Write polygons
-        for poly_vertices, color_index, _, _ in polygons:
-            file.write(f"{len(poly_vertices)} ")
-            file.write(" ".join(map(str, poly_vertices)) + " ")
-            file.write(f"{color_index}\n")
+    if sort_mode == "distance":
+        # Reverse the order so farthest elements are written last
+        polygons.reverse()
+        edges.reverse()
+
+    # Deduplicate edges that occupy the same positions and have the same color
+    deduped_edges = []
+    seen = set()
+    for v1, v2, color_index in edges:
+        p1 = tuple(round(c, 6) for c in new_vertices[v1])
+        p2 = tuple(round(c, 6) for c in new_vertices[v2])
+        key = (p1, p2) if p1 <= p2 else (p2, p1)
+        key = (key, color_index)
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped_edges.append((v1, v2, color_index))
+    edges = deduped_edges
+
+    # Assemble the whole file in memory
+    output = ["3DG1", str(len(new_vertices))]  # Header and total vertex count
+
+    # Vertices, converted back to 3DG1 coordinate system and formatted in a single pass
+    if new_vertices:
+        x, y, z = np.array(new_vertices, dtype=np.int64).T
+        vertex_values = np.column_stack((x, z, -y)).ravel().tolist()
+        output.append(os.linesep.join(["%d %d %d"] * len(new_vertices)) % tuple(vertex_values))
+
+    # Polygons
+    output.extend(
+        f"{len(poly_vertices)} {' '.join(map(str, poly_vertices))} {color_index}"
+        for poly_vertices, color_index, _, _ in polygons
+    )
 
-        # Write edges
-        for v1, v2, color_index in edges:
-            file.write(f"2 {v1} {v2} {color_index}\n")
+    # Edges
+    output.extend(f"2 {v1} {v2} {color_index}" for v1, v2, color_index in edges)
 
-        # End-of-file marker
-        file.write(chr(0x1A))
+    # Write everything at once as bytes, followed by the end-of-file marker
+    # (os.linesep keeps the line endings text mode would have written)
+    with open(filepath, "wb") as file:
+        file.write((os.linesep.join(output) + os.linesep + eof_marker).encode("ascii"))
 
     return {'FINISHED'}
 
@@ -1167,7 +1464,8 @@ class ImportBSPOperator(bpy.types.Operator, ImportHelper):
 # ASM BSP/GZS Importer
 # =========================
     def import_bsp(self, file_path):
-        points = []
+        point_coords = []  # "x,y,z" text of each point line
+        point_mirrored = []  # Whether each point line also adds its inverse-X point
         faces = []
         face_data = []  # Store faces with original order and material indices
         material_map = {}
@@ -1208,15 +1506,12 @@ class ImportBSPOperator(bpy.types.Operator, ImportHelper):
                     if not line_without_comments:
                         continue
 
+                    # Coordinates are converted all at once after the loop
                     _, coords = line_without_comments.split("\t", 1)
-                    x, y, z = map(int, coords.split(","))
-
-                    # Invert X and Y coordinates
-                    x, y = -x, -y
-
-                    points.append((x, -z, y)) # Translate from Star Fox coordinate system to Blender's (Z is up/down)
-                    if invert_x:
-                        points.append((-x, -z, y)) # Translate from Star Fox coordinate system to Blender's (Z is up/down)
+                    if coords.count(",") != 2:
+                        raise ValueError(f"each point needs exactly 3 coordinates: {line_without_comments!r}")
+                    point_coords.append(coords)
+                    point_mirrored.append(invert_x)
 
                 # Handle faces
                 # Make sure the shape itself isn't named "Faces"
@@ -1235,19 +1530,29 @@ class ImportBSPOperator(bpy.types.Operator, ImportHelper):
 
                     material_name = f"FX{material_index}"
                     if material_name not in material_map:
-                        material = bpy.data.materials.get(material_name) or bpy.data.materials.new(name=material_name)
-                        material.use_nodes = True
-                        bsdf = material.node_tree.nodes.get("Principled BSDF")
-                        if bsdf:
-                            # Convert hex to RGB and set the material's base color
-                            hex_color = id_0_c_rgb.get(material_index, "#FFFFFF")  # Default to white
-                            linear_rgb_color = hex_to_rgb(hex_color)
-                            bsdf.inputs["Base Color"].default_value = linear_rgb_color
+                        # Set the material's base color
+                        linear_rgb_color = id_0_c_linear_rgb.get(material_index, white_linear_rgb)  # Default to white
+                        get_fx_material(material_name, linear_rgb_color)
                         material_map[material_name] = len(material_map)
 
                     # Store face data along with its original order
                     face_data.append((original_face_number, tuple(point_indices), material_map[material_name]))
 
+            # Parse every point at once
+            coords = np.fromstring(",".join(point_coords), dtype=np.int64, sep=",")
+            if coords.size != 3 * len(point_coords):
+                raise ValueError("each point needs exactly 3 coordinates")
+            x, y, z = coords.reshape(-1, 3).T
+            x, y = -x, -y  # Invert X and Y coordinates
+            points = np.column_stack((x, -z, y))  # Translate from Star Fox coordinate system to Blender's (Z is up/down)
+
+            # Points from PointsX sections are followed by their inverse-X point
+            point_mirrored = np.array(point_mirrored, dtype=bool)
+            if point_mirrored.any():
+                copies = point_mirrored + 1
+                points = np.repeat(points, copies, axis=0)
+                points[np.cumsum(copies)[point_mirrored] - 1, 0] *= -1
+
             # Sort faces by their original order
             face_data.sort(key=lambda x: x[0])  # Sort by original_face_number
             faces = [face[1] for face in face_data]  # Extract reordered point indices
@@ -1259,8 +1564,12 @@ class ImportBSPOperator(bpy.types.Operator, ImportHelper):
             obj = bpy.data.objects.new(mesh_name, mesh)
             bpy.context.collection.objects.link(obj)
 
-            mesh.from_pydata(points, [], faces)
-            mesh.update()
+            fill_mesh(
+                mesh,
+                points,
+                np.fromiter(map(len, faces), dtype=np.int32, count=len(faces)),
+                np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int32),
+            )
 
             # Assign materials to the mesh
             for material_name, material_index in material_map.items():
@@ -1268,8 +1577,7 @@ class ImportBSPOperator(bpy.types.Operator, ImportHelper):
                 if material:
                     mesh.materials.append(material)
 
-            for i, polygon in enumerate(mesh.polygons):
-                polygon.material_index = material_indices[i]
+            mesh.polygons.foreach_set("material_index", np.array(material_indices, dtype=np.int32))
 
             self.report({'INFO'}, f"Mesh '{mesh_name}' created with {len(points)} points and {len(faces)} faces.")
         except Exception as e:
@@ -1313,22 +1621,23 @@ class Import3DANOperator(bpy.types.Operator):
         point_count = int(lines[1].strip())
         frame_count = int(lines[2].strip()) if is_animated else 1
         
-        # Parse points
-        points = [[] for _ in range(frame_count)]
-        index = 3
-        for frame in range(frame_count):
-            for _ in range(point_count):
-                x, y, z = map(int, lines[index].strip().split())
-                points[frame].append((x, -z, y)) # Translate from 3DG1/3DAN coordinate system to Blender's (Z is up/down)
-                index += 1
+        # Parse the points of every frame in one go
+        index = 3 + frame_count * point_count
+        points = np.fromstring(" ".join(lines[3:index]), dtype=np.float32, sep=" ")
+        if points.size != frame_count * point_count * 3:
+            self.report({'ERROR'}, "Invalid point data")
+            return
+        points = points.reshape(frame_count, point_count, 3)
+        points = np.stack((points[..., 0], -points[..., 2], points[..., 1]), axis=-1) # Translate from 3DG1/3DAN coordinate system to Blender's (Z is up/down)
 
         # Parse polygons
         polygons = []
         while index < len(lines):
             line = lines[index].strip()
             if not line:
+                index += 1
                 continue
-            if line == chr(0x1A):  # EOF marker
+            if line == eof_marker:
                 break
             parts = list(map(int, line.split()))
             npoints = parts[0]
@@ -1337,38 +1646,46 @@ class Import3DANOperator(bpy.types.Operator):
             polygons.append((poly_points, color_index))
             index += 1
         
+        # Create one material per color index, with material slots in order of first use
+        color_to_material_index = {}
+        materials = []
+        for _, color_index in polygons:
+            if color_index in color_to_material_index:
+                continue
+            color_to_material_index[color_index] = len(materials)
+
+            linear_rgb_color = id_0_c_linear_rgb.get(color_index, white_linear_rgb)  # Use a default color (white) if index is not mapped
+            materials.append(get_fx_material(f"FX{color_index}", linear_rgb_color))
+
+        material_indices = np.fromiter(
+            (color_to_material_index[color_index] for _, color_index in polygons),
+            dtype=np.int32, count=len(polygons)
+        )
+
+        # Build the faces and materials once, every frame shares them
+        loop_totals = np.fromiter((len(poly[0]) for poly in polygons), dtype=np.int32, count=len(polygons))
+        loop_vertices = np.fromiter(itertools.chain.from_iterable(poly[0] for poly in polygons), dtype=np.int32)
+        base_mesh = None
+
         # Create Blender objects
         for frame, frame_points in enumerate(points):
-            mesh = bpy.data.meshes.new(f"Frame{frame}")
-            obj = bpy.data.objects.new(f"Frame{frame}", mesh)
-            context.collection.objects.link(obj)
+            if base_mesh is None:
+                mesh = base_mesh = bpy.data.meshes.new(f"Frame{frame}")
+                fill_mesh(mesh, frame_points, loop_totals, loop_vertices)
 
-            mesh.from_pydata(frame_points, [], [poly[0] for poly in polygons])
-            mesh.update()
-
-            # Assign colors as materials
-            for poly, (_, color_index) in zip(mesh.polygons, polygons):
-                # Create a material name based on the color index
-                mat_name = f"FX{color_index}"
-                
-                # Check if the material already exists; otherwise, create it
-                material = bpy.data.materials.get(mat_name) or bpy.data.materials.new(name=mat_name)
-                material.use_nodes = True  # Enable nodes to customize material properties
-                
-                # Access the Principled BSDF node and set the material color
-                bsdf = material.node_tree.nodes.get("Principled BSDF")
-                if bsdf:
-                    hex_color = id_0_c_rgb.get(color_index, "#FFFFFF")  # Use a default color (white) if index is not mapped
-                    linear_rgb_color = hex_to_rgb(hex_color)  # Convert the hex color to linear RGB
-                    bsdf.inputs["Base Color"].default_value = linear_rgb_color  # Set color with alpha
-                
-                # Append the material to the mesh object
-                if obj.data.materials.find(material.name) == -1:
-                    obj.data.materials.append(material)
-                
-                # Assign the material to the polygon
-                poly.material_index = obj.data.materials.find(material.name)
+                # Assign colors as materials
+                for material in materials:
+                    mesh.materials.append(material)
+                mesh.polygons.foreach_set("material_index", material_indices)
+            else:
+                # Later frames copy the first one and only move the points
+                mesh = base_mesh.copy()
+                mesh.name = f"Frame{frame}"
+                mesh.vertices.foreach_set("co", frame_points.ravel())
+                mesh.update()
 
+            obj = bpy.data.objects.new(f"Frame{frame}", mesh)
+            context.collection.objects.link(obj)
 
         self.report({'INFO'}, "3DAN file imported successfully")
 
@@ -1386,41 +1703,50 @@ def write_3dan(filepath, objects, frame_number):
     # Sort objects by name to ensure frames are in the correct order
     sorted_objects = sorted(objects, key=lambda obj: obj.name)
 
+    # Assemble the whole file in memory
+    output = ["3DAN"]  # Header
+    output.append(str(len(sorted_objects[0].data.vertices)))  # Total unique points (assume consistent vertex count)
+    output.append(str(frame_number))  # Number of animation frames
+
+    # Point data per frame, read in bulk and rounded to whole numbers
+    for frame_index in range(frame_number):
+        mesh = sorted_objects[frame_index].data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        if len(co):
+            x, y, z = np.rint(co).astype(np.int64).reshape(-1, 3).T
+            vertex_values = np.column_stack((x, z, -y)).ravel().tolist()  # Translate back to the 3DG1/3DAN coordinate system (Y is up/down)
+            output.append("\n".join(["%d %d %d"] * len(x)) % tuple(vertex_values))
+
+    # Color index of each material slot, from the FX# material name (0 if missing or improperly named)
+    base_mesh = sorted_objects[0].data
+    slot_colors = [
+        material_color_index(material.name) if material and material.name.startswith("FX") else 0
+        for material in base_mesh.materials
+    ]
+    slot_colors.append(0)  # For polygons without a material slot
+
+    # Polygon data (from the first frame's mesh), read in bulk
+    poly_count = len(base_mesh.polygons)
+    material_indices = np.empty(poly_count, dtype=np.int32)
+    loop_starts = np.empty(poly_count, dtype=np.int32)
+    loop_totals = np.empty(poly_count, dtype=np.int32)
+    base_mesh.polygons.foreach_get("material_index", material_indices)
+    base_mesh.polygons.foreach_get("loop_start", loop_starts)
+    base_mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(base_mesh.loops), dtype=np.int32)
+    base_mesh.loops.foreach_get("vertex_index", loop_vertices)
+    poly_colors = np.asarray(slot_colors)[np.minimum(material_indices, len(slot_colors) - 1)]
+
+    loop_vertices = loop_vertices.tolist()
+    output.extend(
+        f"{total} {' '.join(map(str, loop_vertices[start:start + total]))} {color_index}"
+        for start, total, color_index in zip(loop_starts.tolist(), loop_totals.tolist(), poly_colors.tolist())
+    )
+
+    # Write everything at once, followed by the end marker (0x1a character)
     with open(filepath, "w") as f:
-        # Header
-        f.write("3DAN\n")
-        f.write(f"{len(sorted_objects[0].data.vertices)}\n")  # Total unique points (assume consistent vertex count)
-        f.write(f"{frame_number}\n")  # Number of animation frames
-
-        # Write point data per frame
-        for frame_index in range(frame_number):
-            mesh = sorted_objects[frame_index].data
-            for vertex in mesh.vertices:
-                # Convert vertex coordinates to integers
-                x, y, z = (int(round(coord)) for coord in vertex.co)
-                f.write(f"{x} {z} {-(y)}\n")  # Translate back to the 3DG1/3DAN coordinate system (Y is up/down)
-
-        # Write polygon data (from the first frame's mesh)
-        base_mesh = sorted_objects[0].data
-        for poly in base_mesh.polygons:
-            npoints = len(poly.vertices)
-            f.write(f"{npoints} ")
-            f.write(" ".join(map(str, poly.vertices)))
-
-            # Extract color index from material name (if it follows FX# format)
-            mat_index = poly.material_index
-            material = base_mesh.materials[mat_index] if mat_index < len(base_mesh.materials) else None
-            color_index = 0  # Default color index if no material is found or improperly named
-            if material and material.name.startswith("FX"):
-                try:
-                    color_index = int(material.name[2:])  # Extract number after 'FX'
-                except ValueError:
-                    pass  # Leave color_index as 0 if extraction fails
-
-            f.write(f" {color_index}\n")
-
-        # End marker (0x1a character)
-        f.write(chr(0x1a))
+        f.write("\n".join(output) + "\n" + eof_marker)
 
 # =========================
 # 3DAN Export Operator
@@ -1676,8 +2002,12 @@ def collect_data_from_mesh(obj, sort_mode="distance"):
     :param obj: Blender mesh object to export.
     :param sort_mode: Sorting mode ("distance", "material", "none").
     """
+    # Collect all vertex coordinates at once
+    co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", co)
     # Translate from Blender's coordinate system to Star Fox's: Invert all, swap Y/Z
-    original_vertices = [(-(v.co.x), -(v.co.z), -(v.co.y)) for v in obj.data.vertices]
+    x, y, z = -co.astype(np.float64).reshape(-1, 3).T
+    original_vertices = list(zip(x.tolist(), z.tolist(), y.tolist()))
     vertex_pairs = []
     remaining_indices = set(range(len(original_vertices)))
 
@@ -1725,10 +2055,7 @@ def collect_data_from_mesh(obj, sort_mode="distance"):
 
         if material_name.startswith("FE"):
             # If the material indicates edges, create 2-pointed faces for each edge
-            try:
-                color_index = int(material_name[2:])
-            except ValueError:
-                color_index = 0  # Default to 0 if parsing fails
+            color_index = material_color_index(material_name)  # Default to 0 if parsing fails
 
             # Convert the polygon into edges, skipping duplicate edges located at the same positions
             for i in range(len(indices)):
@@ -1750,10 +2077,7 @@ def collect_data_from_mesh(obj, sort_mode="distance"):
 
         else:
             # Handle standard polygons
-            try:
-                color_index = int(material_name[2:]) if material_name.startswith("FX") else 0
-            except ValueError:
-                color_index = 0  # Default to 0 if parsing fails
+            color_index = material_color_index(material_name) if material_name.startswith("FX") else 0  # Default to 0 if parsing fails
 
             # Calculate centroid
             centroid = tuple(
@@ -1886,25 +2210,60 @@ class ExportToGZS(bpy.types.Operator):
 # =========================
 # Super FX Material
 # =========================
-#initialize Super FX node group
+# Super FX node group inputs: socket type, name, default, min and max (None for colors)
+super_fx_inputs = (
+    ('NodeSocketColor', "Colour 1", (0.4178851246833801, 0.02121901698410511, 0.0, 1.0), None, None),
+    ('NodeSocketColor', "Colour 2", (0.9301111102104187, 0.11953844130039215, 0.015208516269922256, 1.0), None, None),
+    ('NodeSocketColor', "Colour 3", (1.0000001192092896, 0.46778395771980286, 0.03071345016360283, 1.0), None, None),
+    ('NodeSocketColor', "Colour 4", (1.0000001192092896, 0.7379106283187866, 0.10224173218011856, 1.0), None, None),
+    ('NodeSocketFloat', "Dither", 96.18470001220703, 0.0, 10000.0),
+    ('NodeSocketFloat', "Aspect X", 8.0, 1.0, 100.0),
+    ('NodeSocketFloat', "Aspect Y", 7.0, 1.0, 100.0),
+    ('NodeSocketFloatAngle', "Angle", 0.0, 0.0, 3.4028234663852886e+38),
+    ('NodeSocketFloatFactor', "Dither 1", 0.0, 0.0, 1.0),
+    ('NodeSocketFloatFactor', "Dither 2", 0.0, 0.0, 1.0),
+    ('NodeSocketFloatFactor', "Dither 3", 0.0, 0.0, 1.0),
+    ('NodeSocketFloatFactor', "Dither 4", 0.0, 0.0, 1.0),
+    ('NodeSocketFloatFactor', "Carry Over", 0.0, 0.0, 1.0),
+)
+
+# Input values of the Super FX node in the SuperFX material
+super_fx_material_inputs = (
+    ("Colour 1", (0.5647116899490356, 0.623960554599762, 0.6724432706832886, 1.0)),
+    ("Colour 2", (0.37626221776008606, 0.34191450476646423, 0.33245155215263367, 1.0)),
+    ("Colour 3", (0.23074008524417877, 0.16513220965862274, 0.17144113779067993, 1.0)),
+    ("Colour 4", (0.14702729880809784, 0.03954625129699707, 0.04091520607471466, 1.0)),
+    ("Dither", 96.18470001220703),
+    ("Aspect X", 8.0),
+    ("Aspect Y", 7.0),
+    ("Angle", 0.0),
+    ("Dither 1", 0.0),
+    ("Dither 2", 0.0),
+    ("Dither 3", 0.0),
+    ("Dither 4", 0.0),
+    ("Carry Over", 0.0),
+)
+
 def super_fx_node_group():
+    """
+    Creates the Super FX node group and a material using it.
 
-    mat = bpy.data.materials.new(name = "SuperFX")
-    mat.use_nodes = True
+    Both are reused if they already exist, so calling this again doesn't leave orphan copies behind.
 
-    """Creates the Super FX node group and a material using it."""
-    # Ensure the node group doesn't already exist
-    if "Super FX" in bpy.data.node_groups:
-        return
+    :return: The Super FX node group.
+    """
+    super_fx = bpy.data.node_groups.get("Super FX") or build_super_fx_node_group()
+    super_fx_material(super_fx)
+    return super_fx
 
+#initialize Super FX node group
+def build_super_fx_node_group():
     super_fx = bpy.data.node_groups.new(type = 'ShaderNodeTree', name = "Super FX")
-
-    mat = bpy.data.materials.new(name = "SuperFX")
-    mat.use_nodes = True
+    new_node = super_fx.nodes.new  # Bound once for all the nodes below
 
     #initialize super_fx nodes
     #node Group Output
-    group_output = super_fx.nodes.new("NodeGroupOutput")
+    group_output = new_node("NodeGroupOutput")
     group_output.name = "Group Output"
     group_output.is_active_output = True
     #super_fx outputs
@@ -1915,7 +2274,7 @@ def super_fx_node_group():
 
 
     #node Mix.006
-    mix_006 = super_fx.nodes.new("ShaderNodeMix")
+    mix_006 = new_node("ShaderNodeMix")
     mix_006.name = "Mix.006"
     mix_006.blend_type = 'MIX'
     mix_006.clamp_factor = True
@@ -1924,17 +2283,17 @@ def super_fx_node_group():
     mix_006.factor_mode = 'UNIFORM'
 
     #node Reroute
-    reroute = super_fx.nodes.new("NodeReroute")
+    reroute = new_node("NodeReroute")
     reroute.name = "Reroute"
     #node Math.007
-    math_007 = super_fx.nodes.new("ShaderNodeMath")
+    math_007 = new_node("ShaderNodeMath")
     math_007.name = "Math.007"
     math_007.hide = True
     math_007.operation = 'ADD'
     math_007.use_clamp = False
 
     #node Map Range.001
-    map_range_001 = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range_001 = new_node("ShaderNodeMapRange")
     map_range_001.name = "Map Range.001"
     map_range_001.hide = True
     map_range_001.clamp = True
@@ -1950,10 +2309,10 @@ def super_fx_node_group():
     map_range_001.inputs[4].default_value = 1.0
 
     #node Reroute.015
-    reroute_015 = super_fx.nodes.new("NodeReroute")
+    reroute_015 = new_node("NodeReroute")
     reroute_015.name = "Reroute.015"
     #node Map Range.004
-    map_range_004 = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range_004 = new_node("ShaderNodeMapRange")
     map_range_004.name = "Map Range.004"
     map_range_004.hide = True
     map_range_004.clamp = True
@@ -1969,7 +2328,7 @@ def super_fx_node_group():
     map_range_004.inputs[4].default_value = 1.0
 
     #node Map Range.005
-    map_range_005 = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range_005 = new_node("ShaderNodeMapRange")
     map_range_005.name = "Map Range.005"
     map_range_005.hide = True
     map_range_005.clamp = True
@@ -1985,34 +2344,34 @@ def super_fx_node_group():
     map_range_005.inputs[4].default_value = 1.0
 
     #node Math.016
-    math_016 = super_fx.nodes.new("ShaderNodeMath")
+    math_016 = new_node("ShaderNodeMath")
     math_016.name = "Math.016"
     math_016.hide = True
     math_016.operation = 'ADD'
     math_016.use_clamp = False
 
     #node Reroute.001
-    reroute_001 = super_fx.nodes.new("NodeReroute")
+    reroute_001 = new_node("NodeReroute")
     reroute_001.name = "Reroute.001"
     #node Reroute.002
-    reroute_002 = super_fx.nodes.new("NodeReroute")
+    reroute_002 = new_node("NodeReroute")
     reroute_002.name = "Reroute.002"
     #node Math.008
-    math_008 = super_fx.nodes.new("ShaderNodeMath")
+    math_008 = new_node("ShaderNodeMath")
     math_008.name = "Math.008"
     math_008.hide = True
     math_008.operation = 'ADD'
     math_008.use_clamp = False
 
     #node Math.010
-    math_010 = super_fx.nodes.new("ShaderNodeMath")
+    math_010 = new_node("ShaderNodeMath")
     math_010.name = "Math.010"
     math_010.hide = True
     math_010.operation = 'ADD'
     math_010.use_clamp = False
 
     #node Map Range
-    map_range = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range = new_node("ShaderNodeMapRange")
     map_range.name = "Map Range"
     map_range.clamp = True
     map_range.data_type = 'FLOAT'
@@ -2027,7 +2386,7 @@ def super_fx_node_group():
     map_range.inputs[4].default_value = 1.0
 
     #node Math
-    math = super_fx.nodes.new("ShaderNodeMath")
+    math = new_node("ShaderNodeMath")
     math.name = "Math"
     math.hide = True
     math.operation = 'COMPARE'
@@ -2038,7 +2397,7 @@ def super_fx_node_group():
     math.inputs[2].default_value = 0.05000000074505806
 
     #node Math.003
-    math_003 = super_fx.nodes.new("ShaderNodeMath")
+    math_003 = new_node("ShaderNodeMath")
     math_003.name = "Math.003"
     math_003.hide = True
     math_003.operation = 'COMPARE'
@@ -2049,7 +2408,7 @@ def super_fx_node_group():
     math_003.inputs[2].default_value = 0.05000000074505806
 
     #node Math.001
-    math_001 = super_fx.nodes.new("ShaderNodeMath")
+    math_001 = new_node("ShaderNodeMath")
     math_001.name = "Math.001"
     math_001.hide = True
     math_001.operation = 'COMPARE'
@@ -2060,7 +2419,7 @@ def super_fx_node_group():
     math_001.inputs[2].default_value = 0.05000000074505806
 
     #node Math.002
-    math_002 = super_fx.nodes.new("ShaderNodeMath")
+    math_002 = new_node("ShaderNodeMath")
     math_002.name = "Math.002"
     math_002.hide = True
     math_002.operation = 'COMPARE'
@@ -2071,7 +2430,7 @@ def super_fx_node_group():
     math_002.inputs[2].default_value = 0.05000000074505806
 
     #node Math.004
-    math_004 = super_fx.nodes.new("ShaderNodeMath")
+    math_004 = new_node("ShaderNodeMath")
     math_004.name = "Math.004"
     math_004.hide = True
     math_004.operation = 'COMPARE'
@@ -2082,7 +2441,7 @@ def super_fx_node_group():
     math_004.inputs[2].default_value = 0.05000000074505806
 
     #node Math.005
-    math_005 = super_fx.nodes.new("ShaderNodeMath")
+    math_005 = new_node("ShaderNodeMath")
     math_005.name = "Math.005"
     math_005.hide = True
     math_005.operation = 'COMPARE'
@@ -2093,13 +2452,13 @@ def super_fx_node_group():
     math_005.inputs[2].default_value = 0.05000000074505806
 
     #node Reroute.005
-    reroute_005 = super_fx.nodes.new("NodeReroute")
+    reroute_005 = new_node("NodeReroute")
     reroute_005.name = "Reroute.005"
     #node Reroute.006
-    reroute_006 = super_fx.nodes.new("NodeReroute")
+    reroute_006 = new_node("NodeReroute")
     reroute_006.name = "Reroute.006"
     #node Math.006
-    math_006 = super_fx.nodes.new("ShaderNodeMath")
+    math_006 = new_node("ShaderNodeMath")
     math_006.name = "Math.006"
     math_006.hide = True
     math_006.operation = 'COMPARE'
@@ -2110,20 +2469,20 @@ def super_fx_node_group():
     math_006.inputs[2].default_value = 0.05000000074505806
 
     #node Reroute.003
-    reroute_003 = super_fx.nodes.new("NodeReroute")
+    reroute_003 = new_node("NodeReroute")
     reroute_003.name = "Reroute.003"
     #node Reroute.004
-    reroute_004 = super_fx.nodes.new("NodeReroute")
+    reroute_004 = new_node("NodeReroute")
     reroute_004.name = "Reroute.004"
     #node Math.009
-    math_009 = super_fx.nodes.new("ShaderNodeMath")
+    math_009 = new_node("ShaderNodeMath")
     math_009.name = "Math.009"
     math_009.hide = True
     math_009.operation = 'ADD'
     math_009.use_clamp = False
 
     #node Mix.001
-    mix_001 = super_fx.nodes.new("ShaderNodeMix")
+    mix_001 = new_node("ShaderNodeMix")
     mix_001.name = "Mix.001"
     mix_001.blend_type = 'MIX'
     mix_001.clamp_factor = True
@@ -2132,36 +2491,36 @@ def super_fx_node_group():
     mix_001.factor_mode = 'UNIFORM'
 
     #node Geometry
-    geometry = super_fx.nodes.new("ShaderNodeNewGeometry")
+    geometry = new_node("ShaderNodeNewGeometry")
     geometry.name = "Geometry"
 
     #node Texture Coordinate
-    texture_coordinate = super_fx.nodes.new("ShaderNodeTexCoord")
+    texture_coordinate = new_node("ShaderNodeTexCoord")
     texture_coordinate.name = "Texture Coordinate"
     texture_coordinate.from_instancer = False
 
     #node Separate XYZ.001
-    separate_xyz_001 = super_fx.nodes.new("ShaderNodeSeparateXYZ")
+    separate_xyz_001 = new_node("ShaderNodeSeparateXYZ")
     separate_xyz_001.name = "Separate XYZ.001"
 
     #node Math.012
-    math_012 = super_fx.nodes.new("ShaderNodeMath")
+    math_012 = new_node("ShaderNodeMath")
     math_012.name = "Math.012"
     math_012.operation = 'MULTIPLY'
     math_012.use_clamp = False
 
     #node Math.011
-    math_011 = super_fx.nodes.new("ShaderNodeMath")
+    math_011 = new_node("ShaderNodeMath")
     math_011.name = "Math.011"
     math_011.operation = 'MULTIPLY'
     math_011.use_clamp = False
 
     #node Separate XYZ
-    separate_xyz = super_fx.nodes.new("ShaderNodeSeparateXYZ")
+    separate_xyz = new_node("ShaderNodeSeparateXYZ")
     separate_xyz.name = "Separate XYZ"
 
     #node Vector Rotate
-    vector_rotate = super_fx.nodes.new("ShaderNodeVectorRotate")
+    vector_rotate = new_node("ShaderNodeVectorRotate")
     vector_rotate.name = "Vector Rotate"
     vector_rotate.invert = False
     vector_rotate.rotation_type = 'AXIS_ANGLE'
@@ -2171,7 +2530,7 @@ def super_fx_node_group():
     vector_rotate.inputs[2].default_value = (0.0, 0.0, 1.0)
 
     #node Mix.007
-    mix_007 = super_fx.nodes.new("ShaderNodeMix")
+    mix_007 = new_node("ShaderNodeMix")
     mix_007.name = "Mix.007"
     mix_007.blend_type = 'MIX'
     mix_007.clamp_factor = True
@@ -2180,13 +2539,13 @@ def super_fx_node_group():
     mix_007.factor_mode = 'UNIFORM'
 
     #node Reroute.012
-    reroute_012 = super_fx.nodes.new("NodeReroute")
+    reroute_012 = new_node("NodeReroute")
     reroute_012.name = "Reroute.012"
     #node Reroute.013
-    reroute_013 = super_fx.nodes.new("NodeReroute")
+    reroute_013 = new_node("NodeReroute")
     reroute_013.name = "Reroute.013"
     #node Mix.005
-    mix_005 = super_fx.nodes.new("ShaderNodeMix")
+    mix_005 = new_node("ShaderNodeMix")
     mix_005.name = "Mix.005"
     mix_005.blend_type = 'MIX'
     mix_005.clamp_factor = True
@@ -2195,7 +2554,7 @@ def super_fx_node_group():
     mix_005.factor_mode = 'UNIFORM'
 
     #node Mix.002
-    mix_002 = super_fx.nodes.new("ShaderNodeMix")
+    mix_002 = new_node("ShaderNodeMix")
     mix_002.name = "Mix.002"
     mix_002.blend_type = 'MIX'
     mix_002.clamp_factor = True
@@ -2204,7 +2563,7 @@ def super_fx_node_group():
     mix_002.factor_mode = 'UNIFORM'
 
     #node Mix.003
-    mix_003 = super_fx.nodes.new("ShaderNodeMix")
+    mix_003 = new_node("ShaderNodeMix")
     mix_003.name = "Mix.003"
     mix_003.blend_type = 'MIX'
     mix_003.clamp_factor = True
@@ -2215,7 +2574,7 @@ def super_fx_node_group():
     mix_003.inputs[6].default_value = (0.0, 0.0, 0.0, 1.0)
 
     #node Mix.004
-    mix_004 = super_fx.nodes.new("ShaderNodeMix")
+    mix_004 = new_node("ShaderNodeMix")
     mix_004.name = "Mix.004"
     mix_004.blend_type = 'MIX'
     mix_004.clamp_factor = True
@@ -2224,75 +2583,66 @@ def super_fx_node_group():
     mix_004.factor_mode = 'UNIFORM'
 
     #node ColorRamp
-    colorramp = super_fx.nodes.new("ShaderNodeValToRGB")
+    colorramp = new_node("ShaderNodeValToRGB")
     colorramp.name = "ColorRamp"
     colorramp.hide = True
     colorramp.color_ramp.color_mode = 'RGB'
     colorramp.color_ramp.hue_interpolation = 'NEAR'
     colorramp.color_ramp.interpolation = 'CONSTANT'
 
-    #initialize color ramp elements
+    #initialize color ramp elements, in ascending position order so each new stop goes at the end
+    #(alpha is set through the color)
     colorramp.color_ramp.elements.remove(colorramp.color_ramp.elements[0])
     colorramp_cre_0 = colorramp.color_ramp.elements[0]
     colorramp_cre_0.position = 0.0
-    colorramp_cre_0.alpha = 1.0
     colorramp_cre_0.color = (0.4178851246833801, 0.02121901698410511, 0.0, 1.0)
 
     colorramp_cre_1 = colorramp.color_ramp.elements.new(0.25)
-    colorramp_cre_1.alpha = 1.0
     colorramp_cre_1.color = (0.9301111102104187, 0.11953844130039215, 0.015208516269922256, 1.0)
 
     colorramp_cre_2 = colorramp.color_ramp.elements.new(0.5)
-    colorramp_cre_2.alpha = 1.0
     colorramp_cre_2.color = (1.0000001192092896, 0.46778395771980286, 0.03071345016360283, 1.0)
 
     colorramp_cre_3 = colorramp.color_ramp.elements.new(0.75)
-    colorramp_cre_3.alpha = 1.0
     colorramp_cre_3.color = (1.0000001192092896, 0.7379106283187866, 0.10224173218011856, 1.0)
 
 
     #node ColorRamp.001
-    colorramp_001 = super_fx.nodes.new("ShaderNodeValToRGB")
+    colorramp_001 = new_node("ShaderNodeValToRGB")
     colorramp_001.name = "ColorRamp.001"
     colorramp_001.hide = True
     colorramp_001.color_ramp.color_mode = 'RGB'
     colorramp_001.color_ramp.hue_interpolation = 'NEAR'
     colorramp_001.color_ramp.interpolation = 'CONSTANT'
 
-    #initialize color ramp elements
+    #initialize color ramp elements, in ascending position order so each new stop goes at the end
+    #(alpha is set through the color)
     colorramp_001.color_ramp.elements.remove(colorramp_001.color_ramp.elements[0])
     colorramp_001_cre_0 = colorramp_001.color_ramp.elements[0]
     colorramp_001_cre_0.position = 0.0
-    colorramp_001_cre_0.alpha = 1.0
     colorramp_001_cre_0.color = (0.1428571492433548, 0.1428571492433548, 0.1428571492433548, 1.0)
 
     colorramp_001_cre_1 = colorramp_001.color_ramp.elements.new(0.1428571343421936)
-    colorramp_001_cre_1.alpha = 1.0
     colorramp_001_cre_1.color = (0.2857142984867096, 0.2857142984867096, 0.2857142984867096, 1.0)
 
     colorramp_001_cre_2 = colorramp_001.color_ramp.elements.new(0.2857142686843872)
-    colorramp_001_cre_2.alpha = 1.0
     colorramp_001_cre_2.color = (0.4285714328289032, 0.4285714328289032, 0.4285714328289032, 1.0)
 
     colorramp_001_cre_3 = colorramp_001.color_ramp.elements.new(0.4285714626312256)
-    colorramp_001_cre_3.alpha = 1.0
     colorramp_001_cre_3.color = (0.5714285969734192, 0.5714285969734192, 0.5714285969734192, 1.0)
 
     colorramp_001_cre_4 = colorramp_001.color_ramp.elements.new(0.5714285969734192)
-    colorramp_001_cre_4.alpha = 1.0
     colorramp_001_cre_4.color = (0.7142857313156128, 0.7142857313156128, 0.7142857313156128, 1.0)
 
     colorramp_001_cre_5 = colorramp_001.color_ramp.elements.new(0.7142857313156128)
-    colorramp_001_cre_5.alpha = 1.0
     colorramp_001_cre_5.color = (0.8571428656578064, 0.8571428656578064, 0.8571428656578064, 1.0)
 
     colorramp_001_cre_6 = colorramp_001.color_ramp.elements.new(0.8571428656578064)
-    colorramp_001_cre_6.alpha = 1.0
     colorramp_001_cre_6.color = (1.0, 1.0, 1.0, 1.0)
 
 
     #node Mix
-    mix = super_fx.nodes.new("ShaderNodeMix")
+    mix = new_node("ShaderNodeMix")
     mix.name = "Mix"
     mix.blend_type = 'MIX'
     mix.clamp_factor = True
@@ -2301,10 +2651,10 @@ def super_fx_node_group():
     mix.factor_mode = 'UNIFORM'
 
     #node Reroute.014
-    reroute_014 = super_fx.nodes.new("NodeReroute")
+    reroute_014 = new_node("NodeReroute")
     reroute_014.name = "Reroute.014"
     #node Map Range.003
-    map_range_003 = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range_003 = new_node("ShaderNodeMapRange")
     map_range_003.name = "Map Range.003"
     map_range_003.hide = True
     map_range_003.clamp = True
@@ -2320,7 +2670,7 @@ def super_fx_node_group():
     map_range_003.inputs[4].default_value = 1.0
 
     #node Map Range.002
-    map_range_002 = super_fx.nodes.new("ShaderNodeMapRange")
+    map_range_002 = new_node("ShaderNodeMapRange")
     map_range_002.name = "Map Range.002"
     map_range_002.hide = True
     map_range_002.clamp = True
@@ -2336,7 +2686,7 @@ def super_fx_node_group():
     map_range_002.inputs[4].default_value = 1.0
 
     #node Mix.010
-    mix_010 = super_fx.nodes.new("ShaderNodeMix")
+    mix_010 = new_node("ShaderNodeMix")
     mix_010.name = "Mix.010"
     mix_010.hide = True
     mix_010.blend_type = 'MIX'
@@ -2346,96 +2696,22 @@ def super_fx_node_group():
     mix_010.factor_mode = 'UNIFORM'
 
     #node Group Input
-    group_input = super_fx.nodes.new("NodeGroupInput")
+    group_input = new_node("NodeGroupInput")
     group_input.name = "Group Input"
     #super_fx inputs
-    #input Colour 1
-    super_fx.inputs.new('NodeSocketColor', "Colour 1")
-    super_fx.inputs[0].default_value = (0.4178851246833801, 0.02121901698410511, 0.0, 1.0)
-    super_fx.inputs[0].attribute_domain = 'POINT'
-
-    #input Colour 2
-    super_fx.inputs.new('NodeSocketColor', "Colour 2")
-    super_fx.inputs[1].default_value = (0.9301111102104187, 0.11953844130039215, 0.015208516269922256, 1.0)
-    super_fx.inputs[1].attribute_domain = 'POINT'
-
-    #input Colour 3
-    super_fx.inputs.new('NodeSocketColor', "Colour 3")
-    super_fx.inputs[2].default_value = (1.0000001192092896, 0.46778395771980286, 0.03071345016360283, 1.0)
-    super_fx.inputs[2].attribute_domain = 'POINT'
-
-    #input Colour 4
-    super_fx.inputs.new('NodeSocketColor', "Colour 4")
-    super_fx.inputs[3].default_value = (1.0000001192092896, 0.7379106283187866, 0.10224173218011856, 1.0)
-    super_fx.inputs[3].attribute_domain = 'POINT'
-
-    #input Dither
-    super_fx.inputs.new('NodeSocketFloat', "Dither")
-    super_fx.inputs[4].default_value = 96.18470001220703
-    super_fx.inputs[4].min_value = 0.0
-    super_fx.inputs[4].max_value = 10000.0
-    super_fx.inputs[4].attribute_domain = 'POINT'
-
-    #input Aspect X
-    super_fx.inputs.new('NodeSocketFloat', "Aspect X")
-    super_fx.inputs[5].default_value = 8.0
-    super_fx.inputs[5].min_value = 1.0
-    super_fx.inputs[5].max_value = 100.0
-    super_fx.inputs[5].attribute_domain = 'POINT'
-
-    #input Aspect Y
-    super_fx.inputs.new('NodeSocketFloat', "Aspect Y")
-    super_fx.inputs[6].default_value = 7.0
-    super_fx.inputs[6].min_value = 1.0
-    super_fx.inputs[6].max_value = 100.0
-    super_fx.inputs[6].attribute_domain = 'POINT'
-
-    #input Angle
-    super_fx.inputs.new('NodeSocketFloatAngle', "Angle")
-    super_fx.inputs[7].default_value = 0.0
-    super_fx.inputs[7].min_value = 0.0
-    super_fx.inputs[7].max_value = 3.4028234663852886e+38
-    super_fx.inputs[7].attribute_domain = 'POINT'
-
-    #input Dither 1
-    super_fx.inputs.new('NodeSocketFloatFactor', "Dither 1")
-    super_fx.inputs[8].default_value = 0.0
-    super_fx.inputs[8].min_value = 0.0
-    super_fx.inputs[8].max_value = 1.0
-    super_fx.inputs[8].attribute_domain = 'POINT'
-
-    #input Dither 2
-    super_fx.inputs.new('NodeSocketFloatFactor', "Dither 2")
-    super_fx.inputs[9].default_value = 0.0
-    super_fx.inputs[9].min_value = 0.0
-    super_fx.inputs[9].max_value = 1.0
-    super_fx.inputs[9].attribute_domain = 'POINT'
-
-    #input Dither 3
-    super_fx.inputs.new('NodeSocketFloatFactor', "Dither 3")
-    super_fx.inputs[10].default_value = 0.0
-    super_fx.inputs[10].min_value = 0.0
-    super_fx.inputs[10].max_value = 1.0
-    super_fx.inputs[10].attribute_domain = 'POINT'
-
-    #input Dither 4
-    super_fx.inputs.new('NodeSocketFloatFactor', "Dither 4")
-    super_fx.inputs[11].default_value = 0.0
-    super_fx.inputs[11].min_value = 0.0
-    super_fx.inputs[11].max_value = 1.0
-    super_fx.inputs[11].attribute_domain = 'POINT'
-
-    #input Carry Over
-    super_fx.inputs.new('NodeSocketFloatFactor', "Carry Over")
-    super_fx.inputs[12].default_value = 0.0
-    super_fx.inputs[12].min_value = 0.0
-    super_fx.inputs[12].max_value = 1.0
-    super_fx.inputs[12].attribute_domain = 'POINT'
+    new_input = super_fx.inputs.new
+    for socket_type, name, default_value, min_value, max_value in super_fx_inputs:
+        socket = new_input(socket_type, name)
+        socket.default_value = default_value
+        if min_value is not None:
+            socket.min_value = min_value
+            socket.max_value = max_value
+        socket.attribute_domain = 'POINT'
 
 
 
     #node Mix.009
-    mix_009 = super_fx.nodes.new("ShaderNodeMix")
+    mix_009 = new_node("ShaderNodeMix")
     mix_009.name = "Mix.009"
     mix_009.hide = True
     mix_009.blend_type = 'MIX'
@@ -2445,40 +2721,40 @@ def super_fx_node_group():
     mix_009.factor_mode = 'UNIFORM'
 
     #node Reroute.019
-    reroute_019 = super_fx.nodes.new("NodeReroute")
+    reroute_019 = new_node("NodeReroute")
     reroute_019.name = "Reroute.019"
     #node Combine XYZ
-    combine_xyz = super_fx.nodes.new("ShaderNodeCombineXYZ")
+    combine_xyz = new_node("ShaderNodeCombineXYZ")
     combine_xyz.name = "Combine XYZ"
     #Z
     combine_xyz.inputs[2].default_value = 0.0
 
     #node Reroute.018
-    reroute_018 = super_fx.nodes.new("NodeReroute")
+    reroute_018 = new_node("NodeReroute")
     reroute_018.name = "Reroute.018"
     #node Checker Texture.001
-    checker_texture_001 = super_fx.nodes.new("ShaderNodeTexChecker")
+    checker_texture_001 = new_node("ShaderNodeTexChecker")
     checker_texture_001.name = "Checker Texture.001"
     checker_texture_001.hide = True
 
     #node Checker Texture.002
-    checker_texture_002 = super_fx.nodes.new("ShaderNodeTexChecker")
+    checker_texture_002 = new_node("ShaderNodeTexChecker")
     checker_texture_002.name = "Checker Texture.002"
     checker_texture_002.hide = True
 
     #node Reroute.017
-    reroute_017 = super_fx.nodes.new("NodeReroute")
+    reroute_017 = new_node("NodeReroute")
     reroute_017.name = "Reroute.017"
     #node Reroute.010
-    reroute_010 = super_fx.nodes.new("NodeReroute")
+    reroute_010 = new_node("NodeReroute")
     reroute_010.name = "Reroute.010"
     #node Checker Texture.003
-    checker_texture_003 = super_fx.nodes.new("ShaderNodeTexChecker")
+    checker_texture_003 = new_node("ShaderNodeTexChecker")
     checker_texture_003.name = "Checker Texture.003"
     checker_texture_003.hide = True
 
     #node Mix.008
-    mix_008 = super_fx.nodes.new("ShaderNodeMix")
+    mix_008 = new_node("ShaderNodeMix")
     mix_008.name = "Mix.008"
     mix_008.hide = True
     mix_008.blend_type = 'MIX'
@@ -2488,7 +2764,7 @@ def super_fx_node_group():
     mix_008.factor_mode = 'UNIFORM'
 
     #node Mix.011
-    mix_011 = super_fx.nodes.new("ShaderNodeMix")
+    mix_011 = new_node("ShaderNodeMix")
     mix_011.name = "Mix.011"
     mix_011.hide = True
     mix_011.blend_type = 'MIX'
@@ -2498,7 +2774,7 @@ def super_fx_node_group():
     mix_011.factor_mode = 'UNIFORM'
 
     #node Mix.012
-    mix_012 = super_fx.nodes.new("ShaderNodeMix")
+    mix_012 = new_node("ShaderNodeMix")
     mix_012.name = "Mix.012"
     mix_012.hide = True
     mix_012.blend_type = 'MIX'
@@ -2508,43 +2784,43 @@ def super_fx_node_group():
     mix_012.factor_mode = 'UNIFORM'
 
     #node Reroute.009
-    reroute_009 = super_fx.nodes.new("NodeReroute")
+    reroute_009 = new_node("NodeReroute")
     reroute_009.name = "Reroute.009"
     #node Reroute.008
-    reroute_008 = super_fx.nodes.new("NodeReroute")
+    reroute_008 = new_node("NodeReroute")
     reroute_008.name = "Reroute.008"
     #node Reroute.007
-    reroute_007 = super_fx.nodes.new("NodeReroute")
+    reroute_007 = new_node("NodeReroute")
     reroute_007.name = "Reroute.007"
     #node Reroute.011
-    reroute_011 = super_fx.nodes.new("NodeReroute")
+    reroute_011 = new_node("NodeReroute")
     reroute_011.name = "Reroute.011"
     #node Math.013
-    math_013 = super_fx.nodes.new("ShaderNodeMath")
+    math_013 = new_node("ShaderNodeMath")
     math_013.name = "Math.013"
     math_013.hide = True
     math_013.operation = 'ADD'
     math_013.use_clamp = False
 
     #node Math.014
-    math_014 = super_fx.nodes.new("ShaderNodeMath")
+    math_014 = new_node("ShaderNodeMath")
     math_014.name = "Math.014"
     math_014.hide = True
     math_014.operation = 'ADD'
     math_014.use_clamp = False
 
     #node Math.015
-    math_015 = super_fx.nodes.new("ShaderNodeMath")
+    math_015 = new_node("ShaderNodeMath")
     math_015.name = "Math.015"
     math_015.hide = True
     math_015.operation = 'ADD'
     math_015.use_clamp = False
 
     #node Reroute.016
-    reroute_016 = super_fx.nodes.new("NodeReroute")
+    reroute_016 = new_node("NodeReroute")
     reroute_016.name = "Reroute.016"
     #node Reroute.020
-    reroute_020 = super_fx.nodes.new("NodeReroute")
+    reroute_020 = new_node("NodeReroute")
     reroute_020.name = "Reroute.020"
 
     #Set locations
@@ -2619,311 +2895,299 @@ def super_fx_node_group():
     reroute_016.location = (-994.7044067382812, -880.1026611328125)
     reroute_020.location = (-575.075439453125, 72.70051574707031)
 
-    #Set dimensions
-    group_output.width, group_output.height = 140.0, 100.0
-    mix_006.width, mix_006.height = 140.0, 100.0
-    reroute.width, reroute.height = 16.0, 100.0
-    math_007.width, math_007.height = 140.0, 100.0
-    map_range_001.width, map_range_001.height = 140.0, 100.0
-    reroute_015.width, reroute_015.height = 16.0, 100.0
-    map_range_004.width, map_range_004.height = 140.0, 100.0
-    map_range_005.width, map_range_005.height = 140.0, 100.0
-    math_016.width, math_016.height = 140.0, 100.0
-    reroute_001.width, reroute_001.height = 16.0, 100.0
-    reroute_002.width, reroute_002.height = 16.0, 100.0
-    math_008.width, math_008.height = 140.0, 100.0
-    math_010.width, math_010.height = 140.0, 100.0
-    map_range.width, map_range.height = 140.0, 100.0
-    math.width, math.height = 140.0, 100.0
-    math_003.width, math_003.height = 140.0, 100.0
-    math_001.width, math_001.height = 140.0, 100.0
-    math_002.width, math_002.height = 140.0, 100.0
-    math_004.width, math_004.height = 140.0, 100.0
-    math_005.width, math_005.height = 140.0, 100.0
-    reroute_005.width, reroute_005.height = 16.0, 100.0
-    reroute_006.width, reroute_006.height = 16.0, 100.0
-    math_006.width, math_006.height = 140.0, 100.0
-    reroute_003.width, reroute_003.height = 16.0, 100.0
-    reroute_004.width, reroute_004.height = 16.0, 100.0
-    math_009.width, math_009.height = 140.0, 100.0
-    mix_001.width, mix_001.height = 134.33251953125, 100.0
-    geometry.width, geometry.height = 140.0, 100.0
-    texture_coordinate.width, texture_coordinate.height = 140.0, 100.0
-    separate_xyz_001.width, separate_xyz_001.height = 140.0, 100.0
-    math_012.width, math_012.height = 140.0, 100.0
-    math_011.width, math_011.height = 140.0, 100.0
-    separate_xyz.width, separate_xyz.height = 140.0, 100.0
-    vector_rotate.width, vector_rotate.height = 140.0, 100.0
-    mix_007.width, mix_007.height = 140.0, 100.0
-    reroute_012.width, reroute_012.height = 16.0, 100.0
-    reroute_013.width, reroute_013.height = 16.0, 100.0
-    mix_005.width, mix_005.height = 140.0, 100.0
-    mix_002.width, mix_002.height = 134.33251953125, 100.0
-    mix_003.width, mix_003.height = 134.33251953125, 100.0
-    mix_004.width, mix_004.height = 140.0, 100.0
-    colorramp.width, colorramp.height = 240.0, 100.0
-    colorramp_001.width, colorramp_001.height = 240.0, 100.0
-    mix.width, mix.height = 134.33251953125, 100.0
-    reroute_014.width, reroute_014.height = 16.0, 100.0
-    map_range_003.width, map_range_003.height = 140.0, 100.0
-    map_range_002.width, map_range_002.height = 140.0, 100.0
-    mix_010.width, mix_010.height = 134.33251953125, 100.0
-    group_input.width, group_input.height = 140.0, 100.0
-    mix_009.width, mix_009.height = 134.33251953125, 100.0
-    reroute_019.width, reroute_019.height = 16.0, 100.0
-    combine_xyz.width, combine_xyz.height = 140.0, 100.0
-    reroute_018.width, reroute_018.height = 16.0, 100.0
-    checker_texture_001.width, checker_texture_001.height = 140.0, 100.0
-    checker_texture_002.width, checker_texture_002.height = 140.0, 100.0
-    reroute_017.width, reroute_017.height = 16.0, 100.0
-    reroute_010.width, reroute_010.height = 16.0, 100.0
-    checker_texture_003.width, checker_texture_003.height = 140.0, 100.0
-    mix_008.width, mix_008.height = 134.33251953125, 100.0
-    mix_011.width, mix_011.height = 134.33251953125, 100.0
-    mix_012.width, mix_012.height = 134.33251953125, 100.0
-    reroute_009.width, reroute_009.height = 16.0, 100.0
-    reroute_008.width, reroute_008.height = 16.0, 100.0
-    reroute_007.width, reroute_007.height = 16.0, 100.0
-    reroute_011.width, reroute_011.height = 16.0, 100.0
-    math_013.width, math_013.height = 140.0, 100.0
-    math_014.width, math_014.height = 140.0, 100.0
-    math_015.width, math_015.height = 140.0, 100.0
-    reroute_016.width, reroute_016.height = 16.0, 100.0
-    reroute_020.width, reroute_020.height = 16.0, 100.0
+    #Set widths (heights are left at the default 100, reroutes have a fixed size)
+    group_output.width = 140.0
+    mix_006.width = 140.0
+    math_007.width = 140.0
+    map_range_001.width = 140.0
+    map_range_004.width = 140.0
+    map_range_005.width = 140.0
+    math_016.width = 140.0
+    math_008.width = 140.0
+    math_010.width = 140.0
+    map_range.width = 140.0
+    math.width = 140.0
+    math_003.width = 140.0
+    math_001.width = 140.0
+    math_002.width = 140.0
+    math_004.width = 140.0
+    math_005.width = 140.0
+    math_006.width = 140.0
+    math_009.width = 140.0
+    mix_001.width = 134.33251953125
+    geometry.width = 140.0
+    texture_coordinate.width = 140.0
+    separate_xyz_001.width = 140.0
+    math_012.width = 140.0
+    math_011.width = 140.0
+    separate_xyz.width = 140.0
+    vector_rotate.width = 140.0
+    mix_007.width = 140.0
+    mix_005.width = 140.0
+    mix_002.width = 134.33251953125
+    mix_003.width = 134.33251953125
+    mix_004.width = 140.0
+    colorramp.width = 240.0
+    colorramp_001.width = 240.0
+    mix.width = 134.33251953125
+    map_range_003.width = 140.0
+    map_range_002.width = 140.0
+    mix_010.width = 134.33251953125
+    group_input.width = 140.0
+    mix_009.width = 134.33251953125
+    combine_xyz.width = 140.0
+    checker_texture_001.width = 140.0
+    checker_texture_002.width = 140.0
+    checker_texture_003.width = 140.0
+    mix_008.width = 134.33251953125
+    mix_011.width = 134.33251953125
+    mix_012.width = 134.33251953125
+    math_013.width = 140.0
+    math_014.width = 140.0
+    math_015.width = 140.0
 
     #initialize super_fx links
+    new_link = super_fx.links.new  # Bound once for all the links below
     #vector_rotate.Vector -> separate_xyz.Vector
-    super_fx.links.new(vector_rotate.outputs[0], separate_xyz.inputs[0])
+    new_link(vector_rotate.outputs[0], separate_xyz.inputs[0])
     #separate_xyz.X -> map_range.Value
-    super_fx.links.new(separate_xyz.outputs[0], map_range.inputs[0])
+    new_link(separate_xyz.outputs[0], map_range.inputs[0])
     #map_range.Result -> colorramp.Fac
-    super_fx.links.new(map_range.outputs[0], colorramp.inputs[0])
+    new_link(map_range.outputs[0], colorramp.inputs[0])
     #map_range.Result -> colorramp_001.Fac
-    super_fx.links.new(map_range.outputs[0], colorramp_001.inputs[0])
+    new_link(map_range.outputs[0], colorramp_001.inputs[0])
     #colorramp_001.Color -> math.Value
-    super_fx.links.new(colorramp_001.outputs[0], math.inputs[0])
+    new_link(colorramp_001.outputs[0], math.inputs[0])
     #colorramp_001.Color -> math_001.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_001.inputs[0])
+    new_link(colorramp_001.outputs[0], math_001.inputs[0])
     #colorramp_001.Color -> math_002.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_002.inputs[0])
+    new_link(colorramp_001.outputs[0], math_002.inputs[0])
     #colorramp_001.Color -> math_003.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_003.inputs[0])
+    new_link(colorramp_001.outputs[0], math_003.inputs[0])
     #colorramp_001.Color -> math_004.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_004.inputs[0])
+    new_link(colorramp_001.outputs[0], math_004.inputs[0])
     #colorramp_001.Color -> math_005.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_005.inputs[0])
+    new_link(colorramp_001.outputs[0], math_005.inputs[0])
     #colorramp_001.Color -> math_006.Value
-    super_fx.links.new(colorramp_001.outputs[0], math_006.inputs[0])
+    new_link(colorramp_001.outputs[0], math_006.inputs[0])
     #math.Value -> mix.Factor
-    super_fx.links.new(math.outputs[0], mix.inputs[0])
+    new_link(math.outputs[0], mix.inputs[0])
     #math_002.Value -> mix_001.Factor
-    super_fx.links.new(math_002.outputs[0], mix_001.inputs[0])
+    new_link(math_002.outputs[0], mix_001.inputs[0])
     #math_004.Value -> mix_002.Factor
-    super_fx.links.new(math_004.outputs[0], mix_002.inputs[0])
+    new_link(math_004.outputs[0], mix_002.inputs[0])
     #math_006.Value -> mix_003.Factor
-    super_fx.links.new(math_006.outputs[0], mix_003.inputs[0])
+    new_link(math_006.outputs[0], mix_003.inputs[0])
     #checker_texture_003.Color -> mix.A
-    super_fx.links.new(checker_texture_003.outputs[0], mix.inputs[6])
+    new_link(checker_texture_003.outputs[0], mix.inputs[6])
     #checker_texture_001.Color -> mix_001.A
-    super_fx.links.new(checker_texture_001.outputs[0], mix_001.inputs[6])
+    new_link(checker_texture_001.outputs[0], mix_001.inputs[6])
     #checker_texture_002.Color -> mix_002.A
-    super_fx.links.new(checker_texture_002.outputs[0], mix_002.inputs[6])
+    new_link(checker_texture_002.outputs[0], mix_002.inputs[6])
     #math.Value -> reroute.Input
-    super_fx.links.new(math.outputs[0], reroute.inputs[0])
+    new_link(math.outputs[0], reroute.inputs[0])
     #math_001.Value -> reroute_001.Input
-    super_fx.links.new(math_001.outputs[0], reroute_001.inputs[0])
+    new_link(math_001.outputs[0], reroute_001.inputs[0])
     #math_002.Value -> reroute_002.Input
-    super_fx.links.new(math_002.outputs[0], reroute_002.inputs[0])
+    new_link(math_002.outputs[0], reroute_002.inputs[0])
     #math_003.Value -> reroute_003.Input
-    super_fx.links.new(math_003.outputs[0], reroute_003.inputs[0])
+    new_link(math_003.outputs[0], reroute_003.inputs[0])
     #math_004.Value -> reroute_004.Input
-    super_fx.links.new(math_004.outputs[0], reroute_004.inputs[0])
+    new_link(math_004.outputs[0], reroute_004.inputs[0])
     #math_005.Value -> reroute_005.Input
-    super_fx.links.new(math_005.outputs[0], reroute_005.inputs[0])
+    new_link(math_005.outputs[0], reroute_005.inputs[0])
     #math_006.Value -> reroute_006.Input
-    super_fx.links.new(math_006.outputs[0], reroute_006.inputs[0])
+    new_link(math_006.outputs[0], reroute_006.inputs[0])
     #reroute.Output -> math_007.Value
-    super_fx.links.new(reroute.outputs[0], math_007.inputs[0])
+    new_link(reroute.outputs[0], math_007.inputs[0])
     #reroute_001.Output -> math_007.Value
-    super_fx.links.new(reroute_001.outputs[0], math_007.inputs[1])
+    new_link(reroute_001.outputs[0], math_007.inputs[1])
     #reroute_002.Output -> math_008.Value
-    super_fx.links.new(reroute_002.outputs[0], math_008.inputs[0])
+    new_link(reroute_002.outputs[0], math_008.inputs[0])
     #reroute_003.Output -> math_008.Value
-    super_fx.links.new(reroute_003.outputs[0], math_008.inputs[1])
+    new_link(reroute_003.outputs[0], math_008.inputs[1])
     #reroute_004.Output -> math_009.Value
-    super_fx.links.new(reroute_004.outputs[0], math_009.inputs[0])
+    new_link(reroute_004.outputs[0], math_009.inputs[0])
     #reroute_005.Output -> math_009.Value
-    super_fx.links.new(reroute_005.outputs[0], math_009.inputs[1])
+    new_link(reroute_005.outputs[0], math_009.inputs[1])
     #math_007.Value -> mix_004.Factor
-    super_fx.links.new(math_007.outputs[0], mix_004.inputs[0])
+    new_link(math_007.outputs[0], mix_004.inputs[0])
     #mix_002.Result -> mix_005.B
-    super_fx.links.new(mix_002.outputs[2], mix_005.inputs[7])
+    new_link(mix_002.outputs[2], mix_005.inputs[7])
     #math_009.Value -> mix_005.Factor
-    super_fx.links.new(math_009.outputs[0], mix_005.inputs[0])
+    new_link(math_009.outputs[0], mix_005.inputs[0])
     #mix_005.Result -> mix_006.A
-    super_fx.links.new(mix_005.outputs[2], mix_006.inputs[6])
+    new_link(mix_005.outputs[2], mix_006.inputs[6])
     #math_007.Value -> math_010.Value
-    super_fx.links.new(math_007.outputs[0], math_010.inputs[0])
+    new_link(math_007.outputs[0], math_010.inputs[0])
     #math_010.Value -> mix_006.Factor
-    super_fx.links.new(math_010.outputs[0], mix_006.inputs[0])
+    new_link(math_010.outputs[0], mix_006.inputs[0])
     #math_008.Value -> math_010.Value
-    super_fx.links.new(math_008.outputs[0], math_010.inputs[1])
+    new_link(math_008.outputs[0], math_010.inputs[1])
     #group_input.Colour 1 -> reroute_007.Input
-    super_fx.links.new(group_input.outputs[0], reroute_007.inputs[0])
+    new_link(group_input.outputs[0], reroute_007.inputs[0])
     #group_input.Colour 2 -> reroute_008.Input
-    super_fx.links.new(group_input.outputs[1], reroute_008.inputs[0])
+    new_link(group_input.outputs[1], reroute_008.inputs[0])
     #group_input.Colour 3 -> reroute_009.Input
-    super_fx.links.new(group_input.outputs[2], reroute_009.inputs[0])
+    new_link(group_input.outputs[2], reroute_009.inputs[0])
     #group_input.Colour 4 -> reroute_010.Input
-    super_fx.links.new(group_input.outputs[3], reroute_010.inputs[0])
+    new_link(group_input.outputs[3], reroute_010.inputs[0])
     #reroute_007.Output -> checker_texture_003.Color1
-    super_fx.links.new(reroute_007.outputs[0], checker_texture_003.inputs[1])
+    new_link(reroute_007.outputs[0], checker_texture_003.inputs[1])
     #reroute_008.Output -> checker_texture_003.Color2
-    super_fx.links.new(reroute_008.outputs[0], checker_texture_003.inputs[2])
+    new_link(reroute_008.outputs[0], checker_texture_003.inputs[2])
     #mix_009.Result -> mix_001.B
-    super_fx.links.new(mix_009.outputs[2], mix_001.inputs[7])
+    new_link(mix_009.outputs[2], mix_001.inputs[7])
     #reroute_009.Output -> checker_texture_001.Color2
-    super_fx.links.new(reroute_009.outputs[0], checker_texture_001.inputs[2])
+    new_link(reroute_009.outputs[0], checker_texture_001.inputs[2])
     #mix_010.Result -> mix_002.B
-    super_fx.links.new(mix_010.outputs[2], mix_002.inputs[7])
+    new_link(mix_010.outputs[2], mix_002.inputs[7])
     #mix_012.Result -> checker_texture_002.Color1
-    super_fx.links.new(mix_012.outputs[2], checker_texture_002.inputs[1])
+    new_link(mix_012.outputs[2], checker_texture_002.inputs[1])
     #reroute_010.Output -> checker_texture_002.Color2
-    super_fx.links.new(reroute_010.outputs[0], checker_texture_002.inputs[2])
+    new_link(reroute_010.outputs[0], checker_texture_002.inputs[2])
     #reroute_010.Output -> mix_003.B
-    super_fx.links.new(reroute_010.outputs[0], mix_003.inputs[7])
+    new_link(reroute_010.outputs[0], mix_003.inputs[7])
     #group_input.Dither -> checker_texture_003.Scale
-    super_fx.links.new(group_input.outputs[4], checker_texture_003.inputs[3])
+    new_link(group_input.outputs[4], checker_texture_003.inputs[3])
     #group_input.Dither -> checker_texture_001.Scale
-    super_fx.links.new(group_input.outputs[4], checker_texture_001.inputs[3])
+    new_link(group_input.outputs[4], checker_texture_001.inputs[3])
     #group_input.Dither -> checker_texture_002.Scale
-    super_fx.links.new(group_input.outputs[4], checker_texture_002.inputs[3])
+    new_link(group_input.outputs[4], checker_texture_002.inputs[3])
     #math_012.Value -> combine_xyz.X
-    super_fx.links.new(math_012.outputs[0], combine_xyz.inputs[0])
+    new_link(math_012.outputs[0], combine_xyz.inputs[0])
     #math_011.Value -> combine_xyz.Y
-    super_fx.links.new(math_011.outputs[0], combine_xyz.inputs[1])
+    new_link(math_011.outputs[0], combine_xyz.inputs[1])
     #separate_xyz_001.Y -> math_011.Value
-    super_fx.links.new(separate_xyz_001.outputs[1], math_011.inputs[0])
+    new_link(separate_xyz_001.outputs[1], math_011.inputs[0])
     #separate_xyz_001.X -> math_012.Value
-    super_fx.links.new(separate_xyz_001.outputs[0], math_012.inputs[0])
+    new_link(separate_xyz_001.outputs[0], math_012.inputs[0])
     #texture_coordinate.Window -> separate_xyz_001.Vector
-    super_fx.links.new(texture_coordinate.outputs[5], separate_xyz_001.inputs[0])
+    new_link(texture_coordinate.outputs[5], separate_xyz_001.inputs[0])
     #group_input.Aspect X -> math_012.Value
-    super_fx.links.new(group_input.outputs[5], math_012.inputs[1])
+    new_link(group_input.outputs[5], math_012.inputs[1])
     #group_input.Aspect Y -> math_011.Value
-    super_fx.links.new(group_input.outputs[6], math_011.inputs[1])
+    new_link(group_input.outputs[6], math_011.inputs[1])
     #geometry.True Normal -> vector_rotate.Vector
-    super_fx.links.new(geometry.outputs[3], vector_rotate.inputs[0])
+    new_link(geometry.outputs[3], vector_rotate.inputs[0])
     #group_input.Angle -> vector_rotate.Angle
-    super_fx.links.new(group_input.outputs[7], vector_rotate.inputs[3])
+    new_link(group_input.outputs[7], vector_rotate.inputs[3])
     #mix_007.Result -> mix_005.A
-    super_fx.links.new(mix_007.outputs[2], mix_005.inputs[6])
+    new_link(mix_007.outputs[2], mix_005.inputs[6])
     #group_input.Dither 1 -> reroute_011.Input
-    super_fx.links.new(group_input.outputs[8], reroute_011.inputs[0])
+    new_link(group_input.outputs[8], reroute_011.inputs[0])
     #reroute_012.Output -> mix_007.Factor
-    super_fx.links.new(reroute_012.outputs[0], mix_007.inputs[0])
+    new_link(reroute_012.outputs[0], mix_007.inputs[0])
     #group_input.Dither 2 -> reroute_013.Input
-    super_fx.links.new(group_input.outputs[9], reroute_013.inputs[0])
+    new_link(group_input.outputs[9], reroute_013.inputs[0])
     #group_input.Dither 3 -> reroute_014.Input
-    super_fx.links.new(group_input.outputs[10], reroute_014.inputs[0])
+    new_link(group_input.outputs[10], reroute_014.inputs[0])
     #math_015.Value -> map_range_001.Value
-    super_fx.links.new(math_015.outputs[0], map_range_001.inputs[0])
+    new_link(math_015.outputs[0], map_range_001.inputs[0])
     #math_013.Value -> map_range_003.Value
-    super_fx.links.new(math_013.outputs[0], map_range_003.inputs[0])
+    new_link(math_013.outputs[0], map_range_003.inputs[0])
     #math_014.Value -> map_range_002.Value
-    super_fx.links.new(math_014.outputs[0], map_range_002.inputs[0])
+    new_link(math_014.outputs[0], map_range_002.inputs[0])
     #mix_004.Result -> mix_006.B
-    super_fx.links.new(mix_004.outputs[2], mix_006.inputs[7])
+    new_link(mix_004.outputs[2], mix_006.inputs[7])
     #mix_001.Result -> mix_004.A
-    super_fx.links.new(mix_001.outputs[2], mix_004.inputs[6])
+    new_link(mix_001.outputs[2], mix_004.inputs[6])
     #mix_003.Result -> mix_007.A
-    super_fx.links.new(mix_003.outputs[2], mix_007.inputs[6])
+    new_link(mix_003.outputs[2], mix_007.inputs[6])
     #mix_002.Result -> mix_007.B
-    super_fx.links.new(mix_002.outputs[2], mix_007.inputs[7])
+    new_link(mix_002.outputs[2], mix_007.inputs[7])
     #mix.Result -> mix_004.B
-    super_fx.links.new(mix.outputs[2], mix_004.inputs[7])
+    new_link(mix.outputs[2], mix_004.inputs[7])
     #reroute_007.Output -> mix_008.A
-    super_fx.links.new(reroute_007.outputs[0], mix_008.inputs[6])
+    new_link(reroute_007.outputs[0], mix_008.inputs[6])
     #mix_008.Result -> mix.B
-    super_fx.links.new(mix_008.outputs[2], mix.inputs[7])
+    new_link(mix_008.outputs[2], mix.inputs[7])
     #checker_texture_003.Color -> mix_008.B
-    super_fx.links.new(checker_texture_003.outputs[0], mix_008.inputs[7])
+    new_link(checker_texture_003.outputs[0], mix_008.inputs[7])
     #map_range_003.Result -> mix_008.Factor
-    super_fx.links.new(map_range_003.outputs[0], mix_008.inputs[0])
+    new_link(map_range_003.outputs[0], mix_008.inputs[0])
     #group_input.Dither 4 -> reroute_015.Input
-    super_fx.links.new(group_input.outputs[11], reroute_015.inputs[0])
+    new_link(group_input.outputs[11], reroute_015.inputs[0])
     #math_016.Value -> map_range_004.Value
-    super_fx.links.new(math_016.outputs[0], map_range_004.inputs[0])
+    new_link(math_016.outputs[0], map_range_004.inputs[0])
     #map_range_004.Result -> reroute_012.Input
-    super_fx.links.new(map_range_004.outputs[0], reroute_012.inputs[0])
+    new_link(map_range_004.outputs[0], reroute_012.inputs[0])
     #reroute_008.Output -> mix_009.A
-    super_fx.links.new(reroute_008.outputs[0], mix_009.inputs[6])
+    new_link(reroute_008.outputs[0], mix_009.inputs[6])
     #map_range_002.Result -> mix_009.Factor
-    super_fx.links.new(map_range_002.outputs[0], mix_009.inputs[0])
+    new_link(map_range_002.outputs[0], mix_009.inputs[0])
     #checker_texture_001.Color -> mix_009.B
-    super_fx.links.new(checker_texture_001.outputs[0], mix_009.inputs[7])
+    new_link(checker_texture_001.outputs[0], mix_009.inputs[7])
     #reroute_009.Output -> mix_010.A
-    super_fx.links.new(reroute_009.outputs[0], mix_010.inputs[6])
+    new_link(reroute_009.outputs[0], mix_010.inputs[6])
     #checker_texture_002.Color -> mix_010.B
-    super_fx.links.new(checker_texture_002.outputs[0], mix_010.inputs[7])
+    new_link(checker_texture_002.outputs[0], mix_010.inputs[7])
     #map_range_001.Result -> mix_010.Factor
-    super_fx.links.new(map_range_001.outputs[0], mix_010.inputs[0])
+    new_link(map_range_001.outputs[0], mix_010.inputs[0])
     #group_input.Carry Over -> reroute_016.Input
-    super_fx.links.new(group_input.outputs[12], reroute_016.inputs[0])
+    new_link(group_input.outputs[12], reroute_016.inputs[0])
     #reroute_016.Output -> map_range_005.Value
-    super_fx.links.new(reroute_016.outputs[0], map_range_005.inputs[0])
+    new_link(reroute_016.outputs[0], map_range_005.inputs[0])
     #reroute_019.Output -> checker_texture_002.Vector
-    super_fx.links.new(reroute_019.outputs[0], checker_texture_002.inputs[0])
+    new_link(reroute_019.outputs[0], checker_texture_002.inputs[0])
     #reroute_018.Output -> checker_texture_001.Vector
-    super_fx.links.new(reroute_018.outputs[0], checker_texture_001.inputs[0])
+    new_link(reroute_018.outputs[0], checker_texture_001.inputs[0])
     #reroute_017.Output -> checker_texture_003.Vector
-    super_fx.links.new(reroute_017.outputs[0], checker_texture_003.inputs[0])
+    new_link(reroute_017.outputs[0], checker_texture_003.inputs[0])
     #combine_xyz.Vector -> reroute_020.Input
-    super_fx.links.new(combine_xyz.outputs[0], reroute_020.inputs[0])
+    new_link(combine_xyz.outputs[0], reroute_020.inputs[0])
     #reroute_020.Output -> reroute_017.Input
-    super_fx.links.new(reroute_020.outputs[0], reroute_017.inputs[0])
+    new_link(reroute_020.outputs[0], reroute_017.inputs[0])
     #reroute_017.Output -> reroute_018.Input
-    super_fx.links.new(reroute_017.outputs[0], reroute_018.inputs[0])
+    new_link(reroute_017.outputs[0], reroute_018.inputs[0])
     #reroute_018.Output -> reroute_019.Input
-    super_fx.links.new(reroute_018.outputs[0], reroute_019.inputs[0])
+    new_link(reroute_018.outputs[0], reroute_019.inputs[0])
     #mix_006.Result -> group_output.Emission
-    super_fx.links.new(mix_006.outputs[2], group_output.inputs[0])
+    new_link(mix_006.outputs[2], group_output.inputs[0])
     #map_range_005.Result -> mix_011.Factor
-    super_fx.links.new(map_range_005.outputs[0], mix_011.inputs[0])
+    new_link(map_range_005.outputs[0], mix_011.inputs[0])
     #mix_011.Result -> checker_texture_001.Color1
-    super_fx.links.new(mix_011.outputs[2], checker_texture_001.inputs[1])
+    new_link(mix_011.outputs[2], checker_texture_001.inputs[1])
     #map_range_005.Result -> mix_012.Factor
-    super_fx.links.new(map_range_005.outputs[0], mix_012.inputs[0])
+    new_link(map_range_005.outputs[0], mix_012.inputs[0])
     #reroute_007.Output -> mix_012.B
-    super_fx.links.new(reroute_007.outputs[0], mix_012.inputs[7])
+    new_link(reroute_007.outputs[0], mix_012.inputs[7])
     #reroute_009.Output -> mix_012.A
-    super_fx.links.new(reroute_009.outputs[0], mix_012.inputs[6])
+    new_link(reroute_009.outputs[0], mix_012.inputs[6])
     #reroute_008.Output -> mix_011.A
-    super_fx.links.new(reroute_008.outputs[0], mix_011.inputs[6])
+    new_link(reroute_008.outputs[0], mix_011.inputs[6])
     #reroute_007.Output -> mix_011.B
-    super_fx.links.new(reroute_007.outputs[0], mix_011.inputs[7])
+    new_link(reroute_007.outputs[0], mix_011.inputs[7])
     #reroute_011.Output -> math_013.Value
-    super_fx.links.new(reroute_011.outputs[0], math_013.inputs[0])
+    new_link(reroute_011.outputs[0], math_013.inputs[0])
     #reroute_013.Output -> math_014.Value
-    super_fx.links.new(reroute_013.outputs[0], math_014.inputs[0])
+    new_link(reroute_013.outputs[0], math_014.inputs[0])
     #reroute_014.Output -> math_015.Value
-    super_fx.links.new(reroute_014.outputs[0], math_015.inputs[0])
+    new_link(reroute_014.outputs[0], math_015.inputs[0])
     #reroute_015.Output -> math_016.Value
-    super_fx.links.new(reroute_015.outputs[0], math_016.inputs[0])
+    new_link(reroute_015.outputs[0], math_016.inputs[0])
     #reroute_016.Output -> math_016.Value
-    super_fx.links.new(reroute_016.outputs[0], math_016.inputs[1])
+    new_link(reroute_016.outputs[0], math_016.inputs[1])
     #reroute_016.Output -> math_015.Value
-    super_fx.links.new(reroute_016.outputs[0], math_015.inputs[1])
+    new_link(reroute_016.outputs[0], math_015.inputs[1])
     #reroute_016.Output -> math_014.Value
-    super_fx.links.new(reroute_016.outputs[0], math_014.inputs[1])
+    new_link(reroute_016.outputs[0], math_014.inputs[1])
     #reroute_016.Output -> math_013.Value
-    super_fx.links.new(reroute_016.outputs[0], math_013.inputs[1])
+    new_link(reroute_016.outputs[0], math_013.inputs[1])
     return super_fx
 
+#initialize SuperFX material
+def super_fx_material(super_fx):
+    mat = bpy.data.materials.get("SuperFX")
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(name = "SuperFX")
+    mat.use_nodes = True
+
     superfx = mat.node_tree
     #start with a clean node tree
-    for node in superfx.nodes:
-        superfx.nodes.remove(node)
+    superfx.nodes.clear()
     
 
     #initialize superfx nodes
@@ -2939,46 +3203,38 @@ def super_fx_node_group():
     group = superfx.nodes.new("ShaderNodeGroup")
     group.name = "Group"
     group.node_tree = super_fx
-    #Input_1
-    group.inputs[0].default_value = (0.5647116899490356, 0.623960554599762, 0.6724432706832886, 1.0)
-    #Input_2
-    group.inputs[1].default_value = (0.37626221776008606, 0.34191450476646423, 0.33245155215263367, 1.0)
-    #Input_3
-    group.inputs[2].default_value = (0.23074008524417877, 0.16513220965862274, 0.17144113779067993, 1.0)
-    #Input_4
-    group.inputs[3].default_value = (0.14702729880809784, 0.03954625129699707, 0.04091520607471466, 1.0)
-    #Input_5
-    group.inputs[4].default_value = 96.18470001220703
-    #Input_6
-    group.inputs[5].default_value = 8.0
-    #Input_7
-    group.inputs[6].default_value = 7.0
-    #Input_8
-    group.inputs[7].default_value = 0.0
-    #Input_9
-    group.inputs[8].default_value = 0.0
-    #Input_10
-    group.inputs[9].default_value = 0.0
-    #Input_11
-    group.inputs[10].default_value = 0.0
-    #Input_12
-    group.inputs[11].default_value = 0.0
-    #Input_13
-    group.inputs[12].default_value = 0.0
+    inputs = group.inputs
+    for input_name, value in super_fx_material_inputs:
+        inputs[input_name].default_value = value
 
 
     #Set locations
     material_output.location = (1847.483154296875, 525.82470703125)
     group.location = (1578.4364013671875, 692.6035766601562)
 
-    #Set dimensions
-    material_output.width, material_output.height = 140.0, 100.0
-    group.width, group.height = 170.5828857421875, 100.0
+    #Set widths
+    material_output.width = 140.0
+    group.width = 170.5828857421875
 
     #initialize superfx links
     #group.Emission -> material_output.Surface
     superfx.links.new(group.outputs[0], material_output.inputs[0])
-    return superfx
+    return mat
+
+def surface_source_node(nodes):
+    """
+    Returns the node feeding the Surface input of the Material Output, for node trees made of just those two nodes.
+
+    :param nodes: Nodes of a material's node tree.
+    :return: The linked node, or None if the tree has any other layout.
+    """
+    if len(nodes) != 2:
+        return None
+    output_node = next((node for node in nodes if node.type == 'OUTPUT_MATERIAL'), None)
+    if output_node is None:
+        return None
+    surface_links = output_node.inputs["Surface"].links
+    return surface_links[0].from_node if surface_links else None
 
 class OBJECT_OT_create_super_fx(bpy.types.Operator):
     """Create the Super FX node group and base material, and set color management to Standard."""
@@ -2986,7 +3242,8 @@ class OBJECT_OT_create_super_fx(bpy.types.Operator):
     bl_label = "Create Super FX Node Group"
 
     def execute(self, context):
-        # Call the function to create the Super FX node group
+        # Call the function to create the Super FX node group, an existing one is reused
+        group_exists = bpy.data.node_groups.get("Super FX") is not None
         super_fx_node_group()
 
         # Set render color management to Standard
@@ -2997,7 +3254,10 @@ class OBJECT_OT_create_super_fx(bpy.types.Operator):
         else:
             self.report({'INFO'}, "Render color management already set to Standard")
 
-        self.report({'INFO'}, "Super FX node group created")
+        if group_exists:
+            self.report({'INFO'}, "Super FX node group already exists, reused it")
+        else:
+            self.report({'INFO'}, "Super FX node group created")
         return {'FINISHED'}
 
 
@@ -3020,28 +3280,45 @@ class OBJECT_OT_apply_material_colors(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Ensure the Super FX node group exists
-        if "Super FX" not in bpy.data.node_groups:
+        super_fx_group = bpy.data.node_groups.get("Super FX")
+        if super_fx_group is None:
             self.report({'WARNING'}, "No Super FX node group")
             return {'CANCELLED'}
 
         for material_slot in obj.material_slots:
             material = material_slot.material
-            if material and (material.name.startswith("FX") or material.name.startswith("FE")):
-                try:
-                    # Extract color index from the material name
-                    color_index = int(material.name[2:])
-                    settings = id_0_c_components_rgb.get(color_index)
-
-                    if not settings:
-                        self.report({'WARNING'}, f"No settings found for material '{material.name}'")
-                        continue
+            material_name = material.name if material else ""
+            if material_name.startswith(("FX", "FE")):
+                # Extract color index from the material name
+                color_index = material_color_index(material_name, None)
+                if color_index is None:
+                    self.report({'WARNING'}, f"Material '{material_name}' has invalid FX# or FE# format")
+                    continue
 
-                    # Ensure the material uses nodes
+                settings = id_0_c_components_linear_rgb.get(color_index)
+
+                if not settings:
+                    self.report({'WARNING'}, f"No settings found for material '{material_name}'")
+                    continue
+
+                # Ensure the material uses nodes
+                if not material.use_nodes:
                     material.use_nodes = True
 
+                node_tree = material.node_tree
+                nodes = node_tree.nodes
+
+                # Reuse the Super FX node of a material that was already set up, only its inputs change
+                super_fx = surface_source_node(nodes)
+                if super_fx is not None and super_fx.type == 'GROUP' and super_fx.node_tree == super_fx_group:
+                    # Reset the inputs this palette entry doesn't set, like a freshly created node
+                    inputs = super_fx.inputs
+                    for _, input_name, default, _, _ in super_fx_inputs:
+                        socket = inputs.get(input_name)
+                        if socket is not None:
+                            socket.default_value = default
+                else:
                     # Clear existing nodes
-                    node_tree = material.node_tree
-                    nodes = node_tree.nodes
                     links = node_tree.links
                     nodes.clear()
 
@@ -3050,29 +3327,18 @@ class OBJECT_OT_apply_material_colors(bpy.types.Operator):
                     output_node.location = (300, 0)
 
                     super_fx = nodes.new(type="ShaderNodeGroup")
-                    super_fx.node_tree = bpy.data.node_groups["Super FX"]
+                    super_fx.node_tree = super_fx_group
                     super_fx.location = (0, 0)
 
                     # Link Super FX to material output
                     links.new(super_fx.outputs["Emission"], output_node.inputs["Surface"])
 
-                    # Assign colors to the Super FX node group inputs
-                    for input_name, value in settings.items():
-                        if input_name.startswith("Colour"):
-                            # Process color inputs
-                            if input_name in super_fx.inputs:
-                                super_fx.inputs[input_name].default_value = hex_to_rgb(value)
-                        else:
-                            # Handle other material settings
-                            if input_name == "Carry Over":
-                                try:
-                                    super_fx.inputs[input_name].default_value = float(value)
-                                except ValueError:
-                                    self.report({'WARNING'}, f"Invalid value for '{input_name}' in material '{material.name}'")
-
-                except ValueError:
-                    self.report({'WARNING'}, f"Material '{material.name}' has invalid FX# or FE# format")
-                    continue
+                # Assign colors and settings to the Super FX node group inputs
+                inputs = super_fx.inputs
+                for input_name, value in settings:
+                    socket = inputs.get(input_name)
+                    if socket is not None:
+                        socket.default_value = value  # Colors are already linear RGB
 
         self.report({'INFO'}, "Palette applied to materials")
         return {'FINISHED'}
@@ -3098,41 +3364,43 @@ class OBJECT_OT_apply_material_colors_simple(bpy.types.Operator):
 
         for material_slot in obj.material_slots:
             material = material_slot.material
-            if material and (material.name.startswith("FX") or material.name.startswith("FE")):
-                try:
-                    # Extract color index and retrieve the color
-                    color_index = int(material.name[2:])
-                    hex_color = id_0_c_rgb.get(color_index, "#FFFFFF")  # Default to white
-
-                    # Convert HEX to linear RGB for Blender
-                    linear_rgb_color = hex_to_rgb(hex_color)
+            material_name = material.name if material else ""
+            if material_name.startswith(("FX", "FE")):
+                # Extract color index and retrieve the color
+                color_index = material_color_index(material_name, None)
+                if color_index is None:
+                    self.report({'WARNING'}, f"Material '{material_name}' has invalid FX# or FE# format")
+                    continue
+                linear_rgb_color = id_0_c_linear_rgb.get(color_index, white_linear_rgb)  # Default to white
 
+                # Skip materials already set up with this color, re-applying would only rebuild the same nodes
+                if material.use_nodes:
+                    bsdf_node = surface_source_node(material.node_tree.nodes)
+                    if bsdf_node is not None and bsdf_node.type == 'BSDF_PRINCIPLED' and np.allclose(bsdf_node.inputs["Base Color"].default_value, linear_rgb_color, rtol=0.0, atol=1e-6):
+                        continue
+                else:
                     # Ensure the material uses nodes
                     material.use_nodes = True
-                    node_tree = material.node_tree
-
-                    # Clear existing nodes
-                    nodes = node_tree.nodes
-                    links = node_tree.links
-                    nodes.clear()
+                node_tree = material.node_tree
 
-                    # Add a new Principled BSDF node
-                    bsdf_node = nodes.new(type="ShaderNodeBsdfPrincipled")
-                    bsdf_node.location = (0, 0)
+                # Clear existing nodes
+                nodes = node_tree.nodes
+                links = node_tree.links
+                nodes.clear()
 
-                    # Set the Base Color
-                    bsdf_node.inputs["Base Color"].default_value = linear_rgb_color
+                # Add a new Principled BSDF node
+                bsdf_node = nodes.new(type="ShaderNodeBsdfPrincipled")
+                bsdf_node.location = (0, 0)
 
-                    # Add a Material Output node
-                    output_node = nodes.new(type="ShaderNodeOutputMaterial")
-                    output_node.location = (300, 0)
+                # Set the Base Color
+                bsdf_node.inputs["Base Color"].default_value = linear_rgb_color
 
-                    # Connect the BSDF to the Surface input of the Material Output
-                    links.new(bsdf_node.outputs["BSDF"], output_node.inputs["Surface"])
+                # Add a Material Output node
+                output_node = nodes.new(type="ShaderNodeOutputMaterial")
+                output_node.location = (300, 0)
 
-                except ValueError:
-                    self.report({'WARNING'}, f"Material '{material.name}' has invalid FX# or FE# format")
-                    continue
+                # Connect the BSDF to the Surface input of the Material Output
+                links.new(bsdf_node.outputs["BSDF"], output_node.inputs["Surface"])
 
         self.report({'INFO'}, "Palette applied to materials")
         return {'FINISHED'}
@@ -3239,51 +3507,40 @@ def menu_func_export(self, context):
 # =========================
 # Registration
 # =========================
+classes = (
+    Import3DG1,
+    Export3DG1,
+    VertexOperation,
+    OBJECT_OT_toggle_backface_culling,
+    OBJECT_OT_apply_material_colors,
+    OBJECT_OT_apply_material_colors_simple,
+    VIEW3D_PT_fastfx_tools,
+    OBJECT_OT_create_super_fx,
+    OBJECT_OT_import_colboxes_clipboard,
+    OBJECT_OT_export_colboxes,
+    OBJECT_OT_update_colboxes,
+    OBJECT_OT_update_colbox_offsets,
+    OBJECT_OT_generate_colbox,
+    ImportBSPOperator,
+    Import3DANOperator,
+    Export3DAN,
+    ExportToBSP,
+    ExportToGZS,
+    AddShapeHeaderPropertiesOperator,
+)
+
+# Registers the classes in order and unregisters them in reverse
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    bpy.utils.register_class(Import3DG1)
-    bpy.utils.register_class(Export3DG1)
-    bpy.utils.register_class(VertexOperation)
-    bpy.utils.register_class(OBJECT_OT_toggle_backface_culling)
+    register_classes()
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
-    bpy.utils.register_class(OBJECT_OT_apply_material_colors)
-    bpy.utils.register_class(OBJECT_OT_apply_material_colors_simple)
-    bpy.utils.register_class(VIEW3D_PT_fastfx_tools)
-    bpy.utils.register_class(OBJECT_OT_create_super_fx)
-    bpy.utils.register_class(OBJECT_OT_import_colboxes_clipboard)
-    bpy.utils.register_class(OBJECT_OT_export_colboxes)
-    bpy.utils.register_class(OBJECT_OT_update_colboxes)
-    bpy.utils.register_class(OBJECT_OT_update_colbox_offsets)
-    bpy.utils.register_class(OBJECT_OT_generate_colbox)
-    bpy.utils.register_class(ImportBSPOperator)
-    bpy.utils.register_class(Import3DANOperator)
-    bpy.utils.register_class(Export3DAN)
-    bpy.utils.register_class(ExportToBSP)
-    bpy.utils.register_class(ExportToGZS)
-    bpy.utils.register_class(AddShapeHeaderPropertiesOperator)
 
 def unregister():
-    bpy.utils.unregister_class(Import3DG1)
-    bpy.utils.unregister_class(Export3DG1)
-    bpy.utils.unregister_class(VertexOperation)
-    bpy.utils.unregister_class(OBJECT_OT_toggle_backface_culling)
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
-    bpy.utils.unregister_class(OBJECT_OT_apply_material_colors)
-    bpy.utils.unregister_class(OBJECT_OT_apply_material_colors_simple)
-    bpy.utils.unregister_class(VIEW3D_PT_fastfx_tools)
-    bpy.utils.unregister_class(OBJECT_OT_create_super_fx)
-    bpy.utils.unregister_class(OBJECT_OT_import_colboxes_clipboard)
-    bpy.utils.unregister_class(OBJECT_OT_export_colboxes)
-    bpy.utils.unregister_class(OBJECT_OT_update_colboxes)
-    bpy.utils.unregister_class(OBJECT_OT_update_colbox_offsets)
-    bpy.utils.unregister_class(OBJECT_OT_generate_colbox)
-    bpy.utils.unregister_class(ImportBSPOperator)
-    bpy.utils.unregister_class(Import3DANOperator)
-    bpy.utils.unregister_class(Export3DAN)
-    bpy.utils.unregister_class(ExportToBSP)
-    bpy.utils.unregister_class(ExportToGZS)
-    bpy.utils.unregister_class(AddShapeHeaderPropertiesOperator)
+    unregister_classes()
 
 if __name__ == "__main__":
     register()